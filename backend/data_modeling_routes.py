@@ -30,6 +30,7 @@ import logging
 import os
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 # Set up logger
@@ -40,13 +41,15 @@ import time
 import threading
 from queue import Queue
 from pydantic import ValidationError
+from pydantic_core import to_json
 
 from databricks_integration import DatabricksUnityService
 from models import (
     DataModelProject, DataTable, TableField, DataModelRelationship,
     DatabricksDataType, ForeignKeyReference, ExistingTableImport,
     DataModelYAMLSerializer, MetricView, MetricViewDimension,
-    MetricViewMeasure, MetricViewJoin, MetricSourceRelationship, TraditionalView
+    MetricViewMeasure, MetricViewJoin, MetricSourceRelationship, TraditionalView,
+    batch_now
 )
 
 def serialize_join(join):
@@ -611,6 +614,19 @@ if not os.path.exists(SAVED_PROJECTS_DIR):
     os.makedirs(SAVED_PROJECTS_DIR)
 
 
+@lru_cache(maxsize=32)
+def _saved_json_project_yaml(path: str, mtime_ns: int, size: int) -> str:
+    """YAML export of a saved JSON project, memoized per file version
+    
+    mtime_ns and size only form part of the cache key: rewriting the file changes them,
+    so repeated downloads of an unchanged project skip the parse/validate/dump work.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        project_data = json.load(f)
+    project = DataModelProject(**project_data['project'])
+    return DataModelYAMLSerializer.to_yaml(project)
+
+
 @data_modeling_bp.route('/warehouses', methods=['GET'])
 def list_warehouses():
     """List available SQL warehouses"""
@@ -1018,7 +1034,7 @@ def import_existing_tables_cross_catalog():
                                 # Send individual table completed update - find the actual target table
                                 target_table = next((t for t in single_table_project.tables if t.name == table_name), None)
                                 if target_table:
-                                    constraints_count = len([r for r in single_table_project.relationships if r.source_table_id == target_table.id or r.target_table_id == target_table.id])
+                                    constraints_count = sum(1 for _ in single_table_project.relationships_for_table(target_table.id))
                                     send_progress_update(session_id, {
                                         'type': 'table_completed',
                                         'table_name': table_name,
@@ -1295,22 +1311,24 @@ def import_existing_tables():
         client = get_sdk_client()
         unity_service = DatabricksUnityService(client)
         
-        if session_id:
-            # Import with progress streaming
-            project = unity_service.import_existing_tables_with_progress(
-                import_request.catalog_name,
-                import_request.schema_name,
-                import_request.table_names,
-                session_id,
-                existing_tables  # Pass existing tables for relationship creation
-            )
-        else:
-            # Import without progress streaming (legacy)
-            project = unity_service.import_existing_tables(
-                import_request.catalog_name,
-                import_request.schema_name,
-                import_request.table_names
-            )
+        # All objects created by one import share a single created_at/updated_at timestamp
+        with batch_now():
+            if session_id:
+                # Import with progress streaming
+                project = unity_service.import_existing_tables_with_progress(
+                    import_request.catalog_name,
+                    import_request.schema_name,
+                    import_request.table_names,
+                    session_id,
+                    existing_tables  # Pass existing tables for relationship creation
+                )
+            else:
+                # Import without progress streaming (legacy)
+                project = unity_service.import_existing_tables(
+                    import_request.catalog_name,
+                    import_request.schema_name,
+                    import_request.table_names
+                )
         
         # Filter out duplicate tables and create relationships with existing tables if provided
         if existing_tables and project.tables:
@@ -1566,7 +1584,8 @@ def import_existing_views():
         service = DatabricksUnityService(client)
         
         # Import views
-        imported_views = service.import_existing_views(catalog_name, schema_name, view_names)
+        with batch_now():
+            imported_views = service.import_existing_views(catalog_name, schema_name, view_names)
         
         # Auto-import referenced tables if requested
         imported_tables = []
@@ -1836,7 +1855,7 @@ def import_existing_views():
                                 'relationship_type': 'view_to_table',
                                 'source_field_id': None,  # Views don't have specific fields for relationships
                                 'target_field_id': None,   # We don't know which specific field is referenced
-                                'constraint_name': f"view_{view.name}_references_{table_ref.split('.')[-1]}",
+                                'constraint_name': f"view_{view.name}_references_{table_ref.rpartition('.')[2]}",
                                 'on_delete': 'NO ACTION',
                                 'on_update': 'NO ACTION'
                             }
@@ -1910,7 +1929,7 @@ def import_existing_views():
                                 'relationship_type': 'metric_view_to_table',
                                 'source_field_id': None,  # Metric views don't have specific fields for relationships
                                 'target_field_id': None,   # We don't know which specific field is referenced
-                                'constraint_name': f"metric_view_{view.name}_references_{table_ref.split('.')[-1]}",
+                                'constraint_name': f"metric_view_{view.name}_references_{table_ref.rpartition('.')[2]}",
                                 'on_delete': 'NO ACTION',
                                 'on_update': 'NO ACTION'
                             }
@@ -1950,7 +1969,7 @@ def import_existing_views():
                     source_table_name = view.source_table_id
                     # Extract just the table name from full name like "carrossoni.tpch.customer" -> "customer"
                     if '.' in source_table_name:
-                        table_name_only = source_table_name.split('.')[-1]
+                        table_name_only = source_table_name.rpartition('.')[2]
                     else:
                         table_name_only = source_table_name
                     
@@ -2435,7 +2454,7 @@ def save_project():
                         existing_project_id = existing_data.get('project', {}).get('id')
                 else:  # YAML file
                     with open(existing_file_path, 'r', encoding='utf-8') as f:
-                        existing_project = DataModelYAMLSerializer.from_yaml(f.read())
+                        existing_project = DataModelYAMLSerializer.from_yaml_stream(f)
                         existing_project_id = existing_project.id
                 
                 # If the project IDs don't match, it's a different project with the same name
@@ -2473,31 +2492,29 @@ def save_project():
             return response, 422
         
         if save_format == 'yaml':
-            # Save as YAML
-            yaml_content = DataModelYAMLSerializer.to_yaml(project)
+            # Save as YAML, streamed to a temp file so a failed dump never truncates an existing save
             save_path = os.path.join(SAVED_PROJECTS_DIR, f"{project_name}.yaml")
+            tmp_path = f"{save_path}.tmp"
             
-            with open(save_path, 'w', encoding='utf-8') as f:
-                f.write(yaml_content)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                DataModelYAMLSerializer.to_yaml_stream(project, f)
+            os.replace(tmp_path, save_path)
         else:
             # Save as JSON
             save_path = os.path.join(SAVED_PROJECTS_DIR, f"{project_name}.json")
             
-            # Use model_dump with mode='json' to handle datetime serialization
-            project_data = project.model_dump(mode='json')
-            
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(
+            # pydantic-core encodes the model (datetimes, enums) straight to UTF-8 JSON bytes;
+            # output matches json.dump(project.model_dump(mode='json'), indent=2, ensure_ascii=False)
+            with open(save_path, 'wb') as f:
+                f.write(to_json(
                     {
                         'name': project_name,
                         'saved_at': datetime.now().isoformat(),
                         'format': save_format,
-                        'project': project_data
+                        'project': project
                     },
-                    f,
-                    indent=2,
-                    ensure_ascii=False
-                )
+                    indent=2
+                ))
         
         response = jsonify({
             'message': f'Project saved successfully as {project_name}',
@@ -2531,7 +2548,7 @@ def load_project(project_name: str):
         if os.path.exists(yaml_path):
             # Load YAML format
             with open(yaml_path, 'r', encoding='utf-8') as f:
-                project = DataModelYAMLSerializer.from_yaml(f.read())
+                project = DataModelYAMLSerializer.from_yaml_stream(f)
             
             saved_data = {
                 'name': project_name,
@@ -2586,7 +2603,7 @@ def list_saved_projects():
                                 project_id = project_data.get('project', {}).get('id')
                         elif file_format == 'yaml':
                             with open(file_path, 'r', encoding='utf-8') as f:
-                                project = DataModelYAMLSerializer.from_yaml(f.read())
+                                project = DataModelYAMLSerializer.from_yaml_stream(f)
                                 project_id = project.id
                     except Exception as e:
                         logger.warning(f"Could not read project ID from {filename}: {e}")
@@ -3236,7 +3253,7 @@ def delete_project(project_identifier: str):
                                     project_id = stored_id
                         elif file_format == 'yaml':
                             with open(file_path, 'r', encoding='utf-8') as f:
-                                project = DataModelYAMLSerializer.from_yaml(f.read())
+                                project = DataModelYAMLSerializer.from_yaml_stream(f)
                                 logger.debug(f"YAML project {filename}: id={project.id}, name={project.name}, looking for={project_identifier}")
                                 if project.id == project_identifier:
                                     found_project = True
@@ -3315,7 +3332,7 @@ def download_project_yaml(project_identifier: str):
                                     project_name = stored_name
                         elif file_format == 'yaml':
                             with open(file_path, 'r', encoding='utf-8') as f:
-                                project = DataModelYAMLSerializer.from_yaml(f.read())
+                                project = DataModelYAMLSerializer.from_yaml_stream(f)
                                 if project.id == project_identifier:
                                     found_project = True
                                     project_name = project.name
@@ -3337,14 +3354,13 @@ def download_project_yaml(project_identifier: str):
         
         # Read the project file
         try:
-            with open(project_file, 'r', encoding='utf-8') as f:
-                if project_file.endswith('.json'):
-                    # Convert JSON to YAML format
-                    project_data = json.load(f)
-                    project = DataModelProject(**project_data['project'])
-                    yaml_content = DataModelYAMLSerializer.to_yaml(project)
-                else:
-                    # Already YAML format
+            if project_file.endswith('.json'):
+                # Convert JSON to YAML format, reusing the last export while the file is unchanged
+                file_stat = os.stat(project_file)
+                yaml_content = _saved_json_project_yaml(project_file, file_stat.st_mtime_ns, file_stat.st_size)
+            else:
+                # Already YAML format
+                with open(project_file, 'r', encoding='utf-8') as f:
                     yaml_content = f.read()
             
             # Create response with YAML content
@@ -3633,10 +3649,11 @@ def import_project():
             # Ensure the directory exists
             os.makedirs(SAVED_PROJECTS_DIR, exist_ok=True)
             
-            # Convert to YAML and save
-            yaml_output = DataModelYAMLSerializer.to_yaml(project)
-            with open(project_file, 'w', encoding='utf-8') as f:
-                f.write(yaml_output)
+            # Convert to YAML and stream it to a temp file, then move it into place
+            tmp_file = f"{project_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                DataModelYAMLSerializer.to_yaml_stream(project, f)
+            os.replace(tmp_file, project_file)
             
             logger.info(f"📤 Successfully imported project: {new_project_name}")
             
@@ -4020,9 +4037,7 @@ def apply_metric_view(project_id: str, metric_view_id: str):
         # If source table found in project, use fully qualified name
         if source_table:
             # Use the table's effective catalog and schema
-            table_catalog = project.get_effective_catalog(source_table.catalog_name)
-            table_schema = project.get_effective_schema(source_table.schema_name)
-            source_table_reference = f"{table_catalog}.{table_schema}.{source_table.name}"
+            source_table_reference = project.get_full_name(source_table)
             logger.info(f"🔍 DEBUG: Using project table reference: '{source_table_reference}'")
         else:
             # If source table not found in project, use the source_table_id as direct table reference
@@ -4253,7 +4268,7 @@ def generate_traditional_view_ddl(project_id: str, traditional_view_id: str):
         # Use traditional view's effective catalog/schema
         effective_catalog = project.get_effective_catalog(traditional_view.catalog_name)
         effective_schema = project.get_effective_schema(traditional_view.schema_name)
-        full_view_name = f"{effective_catalog}.{effective_schema}.{traditional_view.name}"
+        full_view_name = project.get_full_name(traditional_view)
         logger.info(f"🎯 Generating DDL for traditional view '{traditional_view.name}' in {effective_catalog}.{effective_schema}")
         
         # Build DDL with proper Databricks syntax
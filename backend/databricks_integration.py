@@ -1,5 +1,6 @@
 import json
 import logging
+import re
 import time
 import uuid
 from typing import Dict, List, Optional, Tuple, Any, Union
@@ -28,6 +29,25 @@ if hasattr(logging, log_level):
 logger = logging.getLogger(__name__)
 
 
+def _log_and_print(level: int, msg: str, *args) -> None:
+    """Log a message and echo it to stdout, formatting it only once"""
+    logger.log(level, msg, *args)
+    if logger.isEnabledFor(level):
+        print(msg % args if args else msg)
+
+
+# SQL cleanup and table reference patterns for _parse_sql_table_references
+_SQL_LINE_COMMENT_RE = re.compile(r'--.*?\n')
+_SQL_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+_QUALIFIED_NAME = r'([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*){0,2})'
+# FROM references first, then JOIN references; `\bJOIN` also covers INNER/LEFT/RIGHT/FULL/CROSS JOIN
+_TABLE_REFERENCE_RES = (
+    re.compile(r'\bFROM\s+' + _QUALIFIED_NAME, re.IGNORECASE),
+    re.compile(r'\bJOIN\s+' + _QUALIFIED_NAME, re.IGNORECASE),
+)
+
+
 class DatabricksUnityService:
     """Service for interacting with Databricks Unity Catalog"""
     
@@ -283,6 +303,7 @@ class DatabricksUnityService:
             table_id_map = {}  # Maps full_qualified_name -> table_id for reference resolution
             position_index = 0
             results = []
+            imported_tables = []  # Added to the project in one batch once the FK walk completes
             
             logger.info(f"🔍 Starting import with initial tables: {table_names}")
             
@@ -344,7 +365,7 @@ class DatabricksUnityService:
                         # Set source catalog and schema on imported table (use actual source, not project defaults)
                         data_table.catalog_name = table_catalog
                         data_table.schema_name = table_schema
-                        project.tables.append(data_table)
+                        imported_tables.append(data_table)
                         table_id_map[full_table_name] = data_table.id
                         tables_processed.add(full_table_name)
                         position_index += 1
@@ -400,6 +421,8 @@ class DatabricksUnityService:
                             }
                         })
             
+            project.add_tables(imported_tables)
+            
             # Convert temporary FK references to proper object format
             self._convert_temporary_fk_references(project.tables, table_id_map)
             
@@ -512,6 +535,7 @@ class DatabricksUnityService:
             tables_processed = set()
             table_id_map = {}  # Maps full_qualified_name -> table_id for reference resolution
             position_index = 0
+            imported_tables = []  # Added to the project in one batch once the FK walk completes
             
             logger.info(f"🔍 Starting import with initial tables: {table_names}")
             
@@ -536,7 +560,7 @@ class DatabricksUnityService:
                     
                     # Check if this table already exists in the project (same catalog.schema.name)
                     existing_table = None
-                    for existing in project.tables:
+                    for existing in imported_tables:
                         existing_catalog = existing.catalog_name or catalog_name  # fallback to project catalog
                         existing_schema = existing.schema_name or schema_name    # fallback to project schema
                         if (existing.name == table_name and 
@@ -572,7 +596,7 @@ class DatabricksUnityService:
                     # Set source catalog and schema on imported table (use actual source, not project defaults)
                     data_table.catalog_name = table_catalog
                     data_table.schema_name = table_schema
-                    project.tables.append(data_table)
+                    imported_tables.append(data_table)
                     table_id_map[full_table_name] = data_table.id
                     tables_processed.add(full_table_name)
                     position_index += 1
@@ -587,6 +611,8 @@ class DatabricksUnityService:
                             logger.info(f"🔗 Found FK reference to {ref_table_full_name}, adding to import list")
                             all_tables_to_import.add(ref_table_full_name)
             
+            project.add_tables(imported_tables)
+            
             # Convert temporary FK references to proper ForeignKeyReference objects
             logger.info(f"🔄 Converting FK references for {len(project.tables)} tables")
             self._convert_temporary_fk_references(project.tables, table_id_map)
@@ -3594,33 +3620,18 @@ REFERENCES {full_table_name}({constraint['ref_field_name']})"""
     
     def _parse_sql_table_references(self, sql_query: str) -> List[str]:
         """Parse SQL query to extract table references from FROM and JOIN clauses"""
-        import re
-        
         # Remove comments and normalize whitespace
-        sql_clean = re.sub(r'--.*?\n', ' ', sql_query)  # Remove line comments
-        sql_clean = re.sub(r'/\*.*?\*/', ' ', sql_clean, flags=re.DOTALL)  # Remove block comments
-        sql_clean = re.sub(r'\s+', ' ', sql_clean).strip()  # Normalize whitespace
+        sql_clean = _SQL_LINE_COMMENT_RE.sub(' ', sql_query)  # Remove line comments
+        sql_clean = _SQL_BLOCK_COMMENT_RE.sub(' ', sql_clean)  # Remove block comments
+        sql_clean = _WHITESPACE_RE.sub(' ', sql_clean).strip()  # Normalize whitespace
         
-        table_references = []
-        
-        # Pattern to match table references in FROM and JOIN clauses
         # Matches: FROM table_name, JOIN table_name, FROM catalog.schema.table, etc.
-        patterns = [
-            r'\bFROM\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*){0,2})',
-            r'\bJOIN\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*){0,2})',
-            r'\bINNER\s+JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*){0,2})',
-            r'\bLEFT\s+JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*){0,2})',
-            r'\bRIGHT\s+JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*){0,2})',
-            r'\bFULL\s+JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*){0,2})',
-            r'\bCROSS\s+JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*){0,2})',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, sql_clean, re.IGNORECASE)
-            for match in matches:
-                table_ref = match.group(1).strip()
-                if table_ref and table_ref not in table_references:
-                    table_references.append(table_ref)
+        # dict keeps first-seen order while deduplicating
+        table_references = list(dict.fromkeys(
+            match.group(1)
+            for pattern in _TABLE_REFERENCE_RES
+            for match in pattern.finditer(sql_clean)
+        ))
         
         logger.info(f"🔍 Extracted table references from SQL: {table_references}")
         return table_references
@@ -4140,6 +4151,34 @@ REFERENCES {full_table_name}({constraint['ref_field_name']})"""
             logger.error(f"❌ Error getting warehouse ID: {e}")
             return None
 
+    def _exec_ddl_async(self, sql: str, warehouse_id: str, timeout: float = 300):
+        """Submit a statement without blocking and poll it until it reaches a terminal state
+
+        Returns the last statement response; callers check ``response.status.state``.
+        """
+        response = self.client.statement_execution.execute_statement(
+            statement=sql,
+            warehouse_id=warehouse_id,
+            wait_timeout="0s"
+        )
+        statement_id = response.statement_id
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        
+        while response.status.state in [StatementState.PENDING, StatementState.RUNNING]:
+            if time.monotonic() >= deadline:
+                logger.warning(f"⚠️ Statement {statement_id} still {response.status.state} after {timeout}s, cancelling")
+                try:
+                    self.client.statement_execution.cancel_execution(statement_id)
+                except Exception as cancel_error:
+                    logger.warning(f"⚠️ Could not cancel statement {statement_id}: {cancel_error}")
+                break
+            time.sleep(min(2 ** attempt * 0.1, 2.0))
+            attempt += 1
+            response = self.client.statement_execution.get_statement(statement_id)
+        
+        return response
+
     # ===== METRIC VIEW METHODS =====
     
     def generate_metric_view_yaml(self, metric_view: MetricView, source_table: DataTable) -> str:
@@ -4602,7 +4641,7 @@ $$"""
                 
                 # Apply tags if any
                 if metric_view.tags:
-                    self._apply_metric_view_tags(metric_view, catalog_name, schema_name)
+                    self._apply_metric_view_tags(metric_view, catalog_name, schema_name, warehouse_id)
                 
                 return True
             else:
@@ -4672,7 +4711,7 @@ $$"""
                 
                 # Update tags if any
                 if metric_view.tags:
-                    self._apply_metric_view_tags(metric_view, catalog_name, schema_name)
+                    self._apply_metric_view_tags(metric_view, catalog_name, schema_name, warehouse_id)
                 
                 return True
             else:
@@ -4936,27 +4975,39 @@ $$"""
             print(f"❌ {error_msg}")
             return None
     
-    def _apply_metric_view_tags(self, metric_view: MetricView, catalog_name: str, schema_name: str):
-        """Apply tags to a metric view"""
+    def _apply_metric_view_tags(self, metric_view: MetricView, catalog_name: str, schema_name: str, warehouse_id: str = None):
+        """Apply tags to a metric view
+        
+        All non-empty tags are set with a single ALTER VIEW ... SET TAGS statement;
+        if the warehouse rejects it, tags are applied one statement at a time.
+        """
         try:
             full_name = f"{catalog_name}.{schema_name}.{metric_view.name}"
+            tags = {tag_key: tag_value for tag_key, tag_value in metric_view.tags.items() if tag_value}  # Only apply non-empty tags
+            if not tags:
+                return
             
-            for tag_key, tag_value in metric_view.tags.items():
-                if tag_value:  # Only apply non-empty tags
-                    tag_sql = f"ALTER VIEW {full_name} SET TAGS ('{tag_key}' = '{tag_value}')"
-                    
-                    warehouse_id = self._get_warehouse_id()
-                    if warehouse_id:
-                        response = self.client.statement_execution.execute_statement(
-                            statement=tag_sql,
-                            warehouse_id=warehouse_id,
-                            wait_timeout="10s"
-                        )
-                        
-                        if response.status.state == StatementState.SUCCEEDED:
-                            logger.info(f"✅ Applied tag {tag_key}={tag_value} to metric view {full_name}")
-                        else:
-                            logger.warning(f"⚠️ Failed to apply tag {tag_key} to metric view {full_name}")
+            warehouse_id = warehouse_id or self._get_warehouse_id()
+            if not warehouse_id:
+                return
+            
+            tag_list = ", ".join(f"'{tag_key}' = '{tag_value}'" for tag_key, tag_value in tags.items())
+            tag_sql = f"ALTER VIEW {full_name} SET TAGS ({tag_list})"
+            response = self._exec_ddl_async(tag_sql, warehouse_id)
+            
+            if response.status.state == StatementState.SUCCEEDED:
+                logger.info(f"✅ Applied {len(tags)} tag(s) to metric view {full_name}")
+                return
+            
+            logger.warning(f"⚠️ Batched tag statement failed for metric view {full_name}, applying tags individually")
+            for tag_key, tag_value in tags.items():
+                tag_sql = f"ALTER VIEW {full_name} SET TAGS ('{tag_key}' = '{tag_value}')"
+                response = self._exec_ddl_async(tag_sql, warehouse_id)
+                
+                if response.status.state == StatementState.SUCCEEDED:
+                    logger.info(f"✅ Applied tag {tag_key}={tag_value} to metric view {full_name}")
+                else:
+                    logger.warning(f"⚠️ Failed to apply tag {tag_key} to metric view {full_name}")
                             
         except Exception as e:
             logger.warning(f"⚠️ Error applying tags to metric view: {e}")
@@ -5038,8 +5089,7 @@ $$"""
             
             full_name = f"{catalog_name}.{schema_name}.{metric_view_name}"
             
-            logger.info(f"🗑️ Deleting metric view: {full_name}")
-            print(f"🗑️ Deleting metric view: {full_name}")
+            _log_and_print(logging.INFO, "🗑️ Deleting metric view: %s", full_name)
             
             # Use DROP VIEW
             drop_sql = f"DROP VIEW IF EXISTS {full_name}"
@@ -5049,26 +5099,19 @@ $$"""
                 logger.error("❌ No SQL warehouse available for metric view deletion")
                 return False
             
-            response = self.client.statement_execution.execute_statement(
-                statement=drop_sql,
-                warehouse_id=warehouse_id,
-                wait_timeout="10s"
-            )
+            response = self._exec_ddl_async(drop_sql, warehouse_id)
             
             if response.status.state == StatementState.SUCCEEDED:
-                logger.info(f"✅ Metric view deleted successfully: {full_name}")
-                print(f"✅ Metric view deleted successfully: {full_name}")
+                _log_and_print(logging.INFO, "✅ Metric view deleted successfully: %s", full_name)
                 return True
             else:
                 error_msg = f"Failed to delete metric view: {response.status.state}"
-                logger.error(f"❌ {error_msg}")
-                print(f"❌ {error_msg}")
+                _log_and_print(logging.ERROR, "❌ %s", error_msg)
                 return False
                 
         except Exception as e:
             error_msg = f"Error deleting metric view {metric_view_name}: {str(e)}"
-            logger.error(f"❌ {error_msg}")
-            print(f"❌ {error_msg}")
+            _log_and_print(logging.ERROR, "❌ %s", error_msg)
             return False
     
     def create_traditional_view(self, traditional_view, catalog_name: str, schema_name: str) -> bool:
@@ -5121,9 +5164,8 @@ $$"""
             if not create_sql.strip().endswith(';'):
                 create_sql += ";"
             
-            logger.info(f"🎯 Creating traditional view: {full_name}")
+            _log_and_print(logging.INFO, "🎯 Creating traditional view: %s", full_name)
             logger.info(f"📝 SQL: {create_sql}")
-            print(f"🎯 Creating traditional view: {full_name}")
             
             # Execute the SQL
             warehouse_id = self._get_warehouse_id()
@@ -5135,15 +5177,10 @@ $$"""
             try:
                 # Execute the CREATE VIEW statement directly (table references are now qualified)
                 logger.info(f"🔧 Executing CREATE VIEW with qualified table references")
-                response = self.client.statement_execution.execute_statement(
-                    warehouse_id=warehouse_id,
-                    statement=create_sql,
-                    wait_timeout="30s"
-                )
+                response = self._exec_ddl_async(create_sql, warehouse_id)
                 
                 if response.status.state == StatementState.SUCCEEDED:
-                    logger.info(f"✅ Traditional view {traditional_view.name} created successfully")
-                    print(f"✅ Traditional view {traditional_view.name} created successfully")
+                    _log_and_print(logging.INFO, "✅ Traditional view %s created successfully", traditional_view.name)
                     
                     # TODO: Apply tag management using Unity Catalog API when views are supported
                     # Currently, Databricks Unity Catalog API doesn't support 'views' entity type for tagging
@@ -3,6 +3,6 @@ from .data_modeling import (
     DataModelProject, DataTable, TableField, DataModelRelationship,
     DatabricksDataType, ForeignKeyReference, ExistingTableImport,
     MetricView, MetricViewDimension, MetricViewMeasure, MetricViewJoin,
-    MetricSourceRelationship, TraditionalView
+    MetricSourceRelationship, TraditionalView, batch_now
 )
 from .yaml_serializer import DataModelYAMLSerializer
@@ -1,4 +1,5 @@
 import sys
+from dataclasses import dataclass
 from types import NoneType, UnionType
 from typing import Any, Dict, Literal, Optional, Union, get_args, get_origin
 
@@ -15,7 +16,8 @@ class AutoUIOptions(BaseModel):
     group: Optional[str] = None
 
 
-class AutoUIWidgetSpec(BaseModel, arbitrary_types_allowed=True):
+@dataclass(slots=True)
+class AutoUIWidgetSpec:
     field_name: str
     python_type: str
     widget_cls: str
@@ -24,8 +26,18 @@ class AutoUIWidgetSpec(BaseModel, arbitrary_types_allowed=True):
     optional: bool
 
 
+# Maps annotated_types constraint classes to (widget param, constraint attribute)
+_META_DISPATCH = {
+    annotated_types.Ge: ('min', 'ge'),
+    annotated_types.Gt: ('min', 'gt'),
+    annotated_types.Le: ('max', 'le'),
+    annotated_types.Lt: ('max', 'lt'),
+    annotated_types.MultipleOf: ('step', 'multiple_of'),
+}
+
+
 def title_from_snake_case(name):
-    return ' '.join(word.title() for word in name.split('_'))
+    return name.replace('_', ' ').title()
 
 
 def _get_widget_spec(model: BaseModel, field_info: FieldInfo, field_name: str):
@@ -39,16 +51,10 @@ def _get_widget_spec(model: BaseModel, field_info: FieldInfo, field_name: str):
     }
 
     for m in field_info.metadata:
-        if isinstance(m, annotated_types.Ge):
-            params['min'] = m.ge
-        elif isinstance(m, annotated_types.Gt):
-            params['min'] = m.gt
-        elif isinstance(m, annotated_types.Le):
-            params['max'] = m.le
-        elif isinstance(m, annotated_types.Lt):
-            params['max'] = m.lt
-        elif isinstance(m, annotated_types.MultipleOf):
-            params['step'] = m.multiple_of
+        entry = _META_DISPATCH.get(type(m))
+        if entry:
+            key, attr = entry
+            params[key] = getattr(m, attr)
 
     field_is_optional, inner_python_type = _isoptional(python_type)
     if field_is_optional:
@@ -84,9 +90,7 @@ def _get_widget_spec(model: BaseModel, field_info: FieldInfo, field_name: str):
         widget_cls = 'Text'
 
     return AutoUIWidgetSpec(field_name=field_name,
-                            field_info=field_info,
                             python_type=element_python_type.__name__,
-                            requested_ui_options=ui_opts,
                             widget_cls=widget_cls,
                             widget_params=params,
                             widget_group=field_group,
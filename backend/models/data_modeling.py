@@ -1,13 +1,70 @@
+import json
+import re
 import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from operator import attrgetter
+from sys import intern
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, validator, field_validator
 
 from .autoui import AutoUIWidgetSpec, get_ui_spec
 
 
+def _new_id() -> str:
+    """Default factory for model ids (dashed UUID4 string, the same format the routes and frontend use)"""
+    return str(uuid.uuid4())
+
+
+_batch_now: ContextVar[Optional[datetime]] = ContextVar('_batch_now', default=None)
+
+
+def _now() -> datetime:
+    """Default factory for timestamps; returns the shared batch timestamp inside batch_now()"""
+    return _batch_now.get() or datetime.now()
+
+
+@contextmanager
+def batch_now():
+    """Stamp every model created inside the block with a single datetime.now() value"""
+    token = _batch_now.set(datetime.now())
+    try:
+        yield
+    finally:
+        _batch_now.reset(token)
+
+
+def cached_isoformat(obj: BaseModel, attr: str) -> Optional[str]:
+    """ISO-format a timestamp field, reusing the string until the field is reassigned
+    
+    Cache entries are keyed on the identity of the (immutable) datetime, so assigning a
+    new timestamp is picked up on the next call without any invalidation hook.
+    """
+    value = getattr(obj, attr)
+    cached = obj._iso_cache.get(attr)
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    if value is None:
+        return None
+    iso = value.isoformat()
+    obj._iso_cache[attr] = (value, iso)
+    return iso
+
+
+def _intern_str(v: Optional[str]) -> Optional[str]:
+    """Intern values repeated across many objects (catalog/schema names, relationship types)"""
+    return intern(v) if isinstance(v, str) else v
+
+
+def _intern_keys(v: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern the keys of a tags dict"""
+    return {intern(k): value for k, value in v.items()}
+
+
 class DatabricksDataType(str, Enum):
     """Databricks supported data types for Unity Catalog tables"""
     # Numeric types
@@ -48,6 +105,43 @@ class DatabricksDataType(str, Enum):
     ARRAY = "ARRAY"
     MAP = "MAP"
     STRUCT = "STRUCT"
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def values_frozen(cls) -> frozenset:
+        """All type names as a cached frozenset, for O(1) membership checks"""
+        return frozenset(dt.value for dt in cls)
+
+
+# Type-parameter lookup tables, built once at import time
+_ALL_TYPE_VALUES = DatabricksDataType.values_frozen()
+_VALID_ARRAY_ELEMENT_TYPES = _ALL_TYPE_VALUES - {DatabricksDataType.ARRAY.value}
+_VALID_MAP_TYPES = _ALL_TYPE_VALUES - {DatabricksDataType.MAP.value}
+_TYPE_ALIASES = {'INT': 'BIGINT', 'BOOL': 'BOOLEAN'}
+
+_INTERVAL_QUALIFIERS = (
+    'YEAR', 'YEAR TO MONTH', 'MONTH',
+    'DAY', 'DAY TO HOUR', 'DAY TO MINUTE', 'DAY TO SECOND',
+    'HOUR', 'HOUR TO MINUTE', 'HOUR TO SECOND',
+    'MINUTE', 'MINUTE TO SECOND', 'SECOND'
+)
+_VALID_INTERVAL_QUALIFIERS = frozenset(_INTERVAL_QUALIFIERS)
+_VALID_INTERVAL_QUALIFIERS_MSG = ', '.join(_INTERVAL_QUALIFIERS)
+
+# Static GEOGRAPHY/GEOMETRY SRID error messages
+_GEOGRAPHY_ANY_ERR = "GEOGRAPHY(ANY) cannot be persisted in tables"
+_GEOGRAPHY_SRID_ERR = "GEOGRAPHY only supports SRID 4326"
+_GEOGRAPHY_SRID_INVALID_ERR = "GEOGRAPHY SRID must be 4326"
+_GEOMETRY_ANY_ERR = "GEOMETRY(ANY) cannot be persisted in tables"
+_GEOMETRY_SRID_ERR = "GEOMETRY SRID must be non-negative (0 for unknown CRS)"
+_GEOMETRY_SRID_INVALID_ERR = "GEOMETRY SRID must be a valid integer"
+_SRID_PARSE_ERRORS = {
+    DatabricksDataType.GEOGRAPHY: (_GEOGRAPHY_ANY_ERR, _GEOGRAPHY_SRID_INVALID_ERR),
+    DatabricksDataType.GEOMETRY: (_GEOMETRY_ANY_ERR, _GEOMETRY_SRID_INVALID_ERR),
+}
+
+# DECIMAL parameters: "precision" or "precision,scale"
+_DECIMAL_RE = re.compile(r'\s*([+-]?\d+)\s*(?:,\s*([+-]?\d+)\s*)?\Z')
 
 
 class FieldConstraintType(str, Enum):
@@ -59,11 +153,154 @@ class FieldConstraintType(str, Enum):
     CHECK = "CHECK"
 
 
+def _validate_varchar_char(v, data_type):
+    """VARCHAR and CHAR require length parameter"""
+    dt_name = data_type.value
+    if not v or not v.strip():
+        raise ValueError(f"{dt_name} requires a length parameter (e.g., '50')")
+    try:
+        length = int(v.strip())
+    except ValueError:
+        raise ValueError(f"{dt_name} length must be a valid integer")
+    if length <= 0:
+        raise ValueError(f"{dt_name} length must be positive")
+    if length > 65535:  # Databricks VARCHAR/CHAR max length
+        raise ValueError(f"{dt_name} length cannot exceed 65535")
+    return v
+
+
+def _parse_srid(v, data_type) -> int:
+    """Parse the SRID parameter of a GEOGRAPHY/GEOMETRY column ('ANY' cannot be persisted)"""
+    if not v or not v.strip():
+        raise ValueError(f"{data_type.value} requires SRID parameter")
+    any_err, invalid_err = _SRID_PARSE_ERRORS[data_type]
+    srid = v.strip()
+    if srid.upper() == 'ANY':
+        raise ValueError(any_err)
+    try:
+        return int(srid)
+    except ValueError:
+        raise ValueError(invalid_err)
+
+
+def _validate_geospatial(v, data_type):
+    """GEOGRAPHY only supports SRID 4326; GEOMETRY supports many SRIDs (about 11,000)"""
+    srid = _parse_srid(v, data_type)
+    if data_type == DatabricksDataType.GEOGRAPHY:
+        if srid != 4326:
+            raise ValueError(_GEOGRAPHY_SRID_ERR)
+    elif srid < 0:
+        raise ValueError(_GEOMETRY_SRID_ERR)
+    return v
+
+
+@lru_cache(maxsize=128)
+def _normalize_element_type(raw: str) -> str:
+    """Uppercase a nested type name and map common aliases (INT -> BIGINT, BOOL -> BOOLEAN)"""
+    element_type = raw.strip().upper()
+    return _TYPE_ALIASES.get(element_type, element_type)
+
+
+def _validate_array(v, data_type):
+    """ARRAY requires element type"""
+    if not v or not v.strip():
+        raise ValueError("ARRAY requires element type (e.g., 'STRING', 'INT')")
+    # Validate that element type is a valid Databricks type
+    element_type = _normalize_element_type(v)
+    if element_type not in _VALID_ARRAY_ELEMENT_TYPES:
+        raise ValueError(f"ARRAY element type '{element_type}' is not a valid Databricks data type")
+    return v
+
+
+def _validate_map(v, data_type):
+    """MAP requires key and value types"""
+    if not v or not v.strip():
+        raise ValueError("MAP requires key and value types (e.g., 'STRING,INT')")
+    parts = v.strip().split(',')
+    if len(parts) != 2:
+        raise ValueError("MAP requires exactly two types: 'keyType,valueType'")
+    key_type = _normalize_element_type(parts[0])
+    value_type = _normalize_element_type(parts[1])
+    
+    if key_type not in _VALID_MAP_TYPES:
+        raise ValueError(f"MAP key type '{key_type}' is not a valid Databricks data type")
+    if value_type not in _VALID_MAP_TYPES:
+        raise ValueError(f"MAP value type '{value_type}' is not a valid Databricks data type")
+    return v
+
+
+def _validate_struct(v, data_type):
+    """STRUCT requires field definitions (simplified validation for now)"""
+    if not v or not v.strip():
+        raise ValueError("STRUCT requires field definitions (e.g., 'field1:STRING,field2:INT')")
+    # Basic validation - should contain field definitions
+    if ':' not in v:
+        raise ValueError("STRUCT fields must be in format 'fieldName:fieldType'")
+    return v
+
+
+def _validate_interval(v, data_type):
+    """INTERVAL requires qualifier"""
+    if not v or not v.strip():
+        raise ValueError("INTERVAL requires qualifier (e.g., 'YEAR TO MONTH', 'DAY TO SECOND')")
+    qualifier = v.strip().upper()
+    if qualifier not in _VALID_INTERVAL_QUALIFIERS:
+        raise ValueError(f"INTERVAL qualifier '{qualifier}' is not valid. Must be one of: {_VALID_INTERVAL_QUALIFIERS_MSG}")
+    return v
+
+
+def _validate_decimal(v, data_type):
+    """DECIMAL requires precision and optionally scale"""
+    if not v or not v.strip():
+        raise ValueError("DECIMAL requires precision parameter (e.g., '10,2' or '10')")
+    # Allow both "10,2" and "10" formats
+    match = _DECIMAL_RE.match(v)
+    if not match:
+        if v.count(',') > 1:
+            raise ValueError("DECIMAL parameters should be 'precision' or 'precision,scale'")
+        raise ValueError("DECIMAL parameters must be valid integers")
+    precision = int(match.group(1))
+    if precision <= 0 or precision > 38:
+        raise ValueError("DECIMAL precision must be between 1 and 38")
+    if match.group(2) is not None:
+        scale = int(match.group(2))
+        if scale < 0 or scale > precision:
+            raise ValueError("DECIMAL scale must be between 0 and precision")
+    return v
+
+
+# Per-type validators for TableField.type_parameters
+_TYPE_PARAM_VALIDATORS = {
+    DatabricksDataType.VARCHAR: _validate_varchar_char,
+    DatabricksDataType.CHAR: _validate_varchar_char,
+    DatabricksDataType.GEOGRAPHY: _validate_geospatial,
+    DatabricksDataType.GEOMETRY: _validate_geospatial,
+    DatabricksDataType.ARRAY: _validate_array,
+    DatabricksDataType.MAP: _validate_map,
+    DatabricksDataType.STRUCT: _validate_struct,
+    DatabricksDataType.INTERVAL: _validate_interval,
+    DatabricksDataType.DECIMAL: _validate_decimal,
+}
+
+
+class ForeignKeyReference(BaseModel):
+    """Represents a foreign key reference"""
+    model_config = ConfigDict(extra='ignore')
+    
+    referenced_table_id: str = Field(description="ID of the referenced table")
+    referenced_field_id: str = Field(description="ID of the referenced field")
+    constraint_name: Optional[str] = Field(default=None, description="Name of the FK constraint")
+    on_delete: Optional[str] = Field(default="NO ACTION", description="ON DELETE action")
+    on_update: Optional[str] = Field(default="NO ACTION", description="ON UPDATE action")
+    
+    _intern_actions = field_validator('on_delete', 'on_update')(_intern_str)
+
+
 class TableField(BaseModel):
     """Represents a field/column in a table"""
     model_config = ConfigDict(extra='allow', validate_assignment=True)
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str = Field(description="Field name")
     data_type: DatabricksDataType = Field(description="Data type of the field")
     type_parameters: Optional[str] = Field(default=None, description="Type parameters (e.g., VARCHAR(50), DECIMAL(10,2))")
@@ -76,220 +313,60 @@ class TableField(BaseModel):
     # Constraints
     is_primary_key: bool = Field(default=False, description="Whether this field is part of primary key")
     is_foreign_key: bool = Field(default=False, description="Whether this field is a foreign key")
-    foreign_key_reference: Optional['ForeignKeyReference'] = Field(default=None, description="Foreign key reference details")
+    foreign_key_reference: Optional[ForeignKeyReference] = Field(default=None, description="Foreign key reference details")
     
     # UI positioning for ERD
     position_x: Optional[float] = Field(default=None, description="X position in ERD")
     position_y: Optional[float] = Field(default=None, description="Y position in ERD")
     
+    _intern_tag_keys = field_validator('tags')(_intern_keys)
     
-    @field_validator('type_parameters')
+    @field_validator('type_parameters', mode='before')
     @classmethod
-    def validate_type_parameters(cls, v, info):
-        if v is not None:
+    def _coerce_type_params_to_str(cls, v, info):
+        """Normalize frontend input shapes into a plain, unquoted string"""
+        is_decimal = info.data.get('data_type') == DatabricksDataType.DECIMAL
+        if isinstance(v, str):
             # Remove extra quotes if present (fix for frontend sending quoted values)
-            if isinstance(v, str) and v.startswith('"') and v.endswith('"'):
+            if v.startswith('"') and v.endswith('"'):
                 v = v[1:-1]  # Remove surrounding quotes
-            
-            data_type = info.data.get('data_type')
-            
-            # VARCHAR and CHAR require length parameter
-            if data_type in [DatabricksDataType.VARCHAR, DatabricksDataType.CHAR]:
-                if not v or not v.strip():
-                    raise ValueError(f"{data_type.value} requires a length parameter (e.g., '50')")
+            # Handle DECIMAL JSON string format from frontend
+            if is_decimal and v.startswith('{') and v.endswith('}'):
                 try:
-                    length = int(v.strip())
-                    if length <= 0:
-                        raise ValueError(f"{data_type.value} length must be positive")
-                    if length > 65535:  # Databricks VARCHAR/CHAR max length
-                        raise ValueError(f"{data_type.value} length cannot exceed 65535")
-                except ValueError as e:
-                    if "invalid literal" in str(e):
-                        raise ValueError(f"{data_type.value} length must be a valid integer")
-                    raise e
-            
-            # GEOGRAPHY and GEOMETRY require SRID parameter
-            elif data_type in [DatabricksDataType.GEOGRAPHY, DatabricksDataType.GEOMETRY]:
-                if not v or not v.strip():
-                    raise ValueError(f"{data_type.value} requires SRID parameter")
-                srid = v.strip()
-                
-                if data_type == DatabricksDataType.GEOGRAPHY:
-                    # GEOGRAPHY only supports SRID 4326
-                    if srid.upper() == 'ANY':
-                        raise ValueError("GEOGRAPHY(ANY) cannot be persisted in tables")
-                    try:
-                        srid_int = int(srid)
-                        if srid_int != 4326:
-                            raise ValueError("GEOGRAPHY only supports SRID 4326")
-                    except ValueError as e:
-                        if "invalid literal" in str(e):
-                            raise ValueError("GEOGRAPHY SRID must be 4326")
-                        raise e
-                        
-                elif data_type == DatabricksDataType.GEOMETRY:
-                    # GEOMETRY supports many SRIDs (about 11,000)
-                    if srid.upper() == 'ANY':
-                        raise ValueError("GEOMETRY(ANY) cannot be persisted in tables")
-                    try:
-                        srid_int = int(srid)
-                        if srid_int < 0:
-                            raise ValueError("GEOMETRY SRID must be non-negative (0 for unknown CRS)")
-                    except ValueError as e:
-                        if "invalid literal" in str(e):
-                            raise ValueError("GEOMETRY SRID must be a valid integer")
-                        raise e
-            
-            # ARRAY requires element type
-            elif data_type == DatabricksDataType.ARRAY:
-                if not v or not v.strip():
-                    raise ValueError("ARRAY requires element type (e.g., 'STRING', 'INT')")
-                # Validate that element type is a valid Databricks type
-                element_type = v.strip().upper()
-                # Map common type aliases
-                if element_type == 'INT':
-                    element_type = 'BIGINT'
-                elif element_type == 'BOOL':
-                    element_type = 'BOOLEAN'
-                
-                valid_types = [dt.value for dt in DatabricksDataType if dt != DatabricksDataType.ARRAY]
-                if element_type not in valid_types:
-                    raise ValueError(f"ARRAY element type '{element_type}' is not a valid Databricks data type")
-            
-            # MAP requires key and value types
-            elif data_type == DatabricksDataType.MAP:
-                if not v or not v.strip():
-                    raise ValueError("MAP requires key and value types (e.g., 'STRING,INT')")
-                parts = v.strip().split(',')
-                if len(parts) != 2:
-                    raise ValueError("MAP requires exactly two types: 'keyType,valueType'")
-                key_type = parts[0].strip().upper()
-                value_type = parts[1].strip().upper()
-                
-                # Map common type aliases
-                if key_type == 'INT':
-                    key_type = 'BIGINT'
-                elif key_type == 'BOOL':
-                    key_type = 'BOOLEAN'
-                if value_type == 'INT':
-                    value_type = 'BIGINT'
-                elif value_type == 'BOOL':
-                    value_type = 'BOOLEAN'
-                
-                valid_types = [dt.value for dt in DatabricksDataType if dt != DatabricksDataType.MAP]
-                if key_type not in valid_types:
-                    raise ValueError(f"MAP key type '{key_type}' is not a valid Databricks data type")
-                if value_type not in valid_types:
-                    raise ValueError(f"MAP value type '{value_type}' is not a valid Databricks data type")
-            
-            # STRUCT requires field definitions (simplified validation for now)
-            elif data_type == DatabricksDataType.STRUCT:
-                if not v or not v.strip():
-                    raise ValueError("STRUCT requires field definitions (e.g., 'field1:STRING,field2:INT')")
-                # Basic validation - should contain field definitions
-                if ':' not in v:
-                    raise ValueError("STRUCT fields must be in format 'fieldName:fieldType'")
-            
-            # INTERVAL requires qualifier
-            elif data_type == DatabricksDataType.INTERVAL:
-                if not v or not v.strip():
-                    raise ValueError("INTERVAL requires qualifier (e.g., 'YEAR TO MONTH', 'DAY TO SECOND')")
-                qualifier = v.strip().upper()
-                valid_qualifiers = [
-                    'YEAR', 'YEAR TO MONTH', 'MONTH',
-                    'DAY', 'DAY TO HOUR', 'DAY TO MINUTE', 'DAY TO SECOND',
-                    'HOUR', 'HOUR TO MINUTE', 'HOUR TO SECOND',
-                    'MINUTE', 'MINUTE TO SECOND', 'SECOND'
-                ]
-                if qualifier not in valid_qualifiers:
-                    raise ValueError(f"INTERVAL qualifier '{qualifier}' is not valid. Must be one of: {', '.join(valid_qualifiers)}")
-            
-            # DECIMAL requires precision and optionally scale
-            elif data_type == DatabricksDataType.DECIMAL:
-                # Handle both string format ("10,2") and dict format (from frontend)
-                if isinstance(v, str):
-                    # Remove extra quotes if present (fix for frontend sending "11,1" instead of 11,1)
-                    if v.startswith('"') and v.endswith('"'):
-                        v = v[1:-1]  # Remove surrounding quotes
-                    
-                    # Handle JSON string format from frontend
-                    if v.startswith('{') and v.endswith('}'):
-                        try:
-                            import json
-                            dict_params = json.loads(v)
-                            precision = dict_params.get('precision', 10)
-                            scale = dict_params.get('scale', 0)
-                            # Convert to string format
-                            v = f"{precision},{scale}" if scale > 0 else str(precision)
-                        except (json.JSONDecodeError, KeyError, TypeError):
-                            pass  # Fall through to normal string processing
-                    
-                    if not v or not v.strip():
-                        raise ValueError("DECIMAL requires precision parameter (e.g., '10,2' or '10')")
-                    # Allow both "10,2" and "10" formats
-                    parts = v.strip().split(',')
-                    if len(parts) > 2:
-                        raise ValueError("DECIMAL parameters should be 'precision' or 'precision,scale'")
-                    try:
-                        precision = int(parts[0].strip())
-                        if precision <= 0 or precision > 38:
-                            raise ValueError("DECIMAL precision must be between 1 and 38")
-                        if len(parts) == 2:
-                            scale = int(parts[1].strip())
-                            if scale < 0 or scale > precision:
-                                raise ValueError("DECIMAL scale must be between 0 and precision")
-                    except ValueError as e:
-                        if "invalid literal" in str(e):
-                            raise ValueError("DECIMAL parameters must be valid integers")
-                        raise e
-                elif isinstance(v, dict):
-                    # Handle dict format directly
-                    precision = v.get('precision', 10)
-                    scale = v.get('scale', 0)
-                    if not isinstance(precision, int) or not isinstance(scale, int):
-                        raise ValueError("DECIMAL precision and scale must be integers")
-                    if precision <= 0 or precision > 38:
-                        raise ValueError("DECIMAL precision must be between 1 and 38")
-                    if scale < 0 or scale > precision:
-                        raise ValueError("DECIMAL scale must be between 0 and precision")
-                    # Convert to string format for consistency
+                    dict_params = json.loads(v)
+                    precision = dict_params.get('precision', 10)
+                    scale = dict_params.get('scale', 0)
                     v = f"{precision},{scale}" if scale > 0 else str(precision)
-                else:
-                    raise ValueError("DECIMAL parameters must be a string or dict")
-            
-            # GEOGRAPHY and GEOMETRY can have SRID parameter
-            elif data_type in [DatabricksDataType.GEOGRAPHY, DatabricksDataType.GEOMETRY]:
-                if v and v.strip():
-                    srid = v.strip().upper()
-                    if srid != "ANY":
-                        try:
-                            srid_int = int(srid)
-                            if srid_int < 0:
-                                raise ValueError(f"{data_type.value} SRID must be positive or 'ANY'")
-                        except ValueError as e:
-                            if "invalid literal" in str(e):
-                                raise ValueError(f"{data_type.value} SRID must be an integer or 'ANY'")
-                            raise e
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    pass  # Left as-is; the DECIMAL validator reports it
+            return v
+        if isinstance(v, dict) and is_decimal:
+            # Handle dict format (from frontend)
+            precision = v.get('precision', 10)
+            scale = v.get('scale', 0)
+            if not isinstance(precision, int) or not isinstance(scale, int):
+                raise ValueError("DECIMAL precision and scale must be integers")
+            return f"{precision},{scale}" if scale > 0 else str(precision)
+        return v
+    
+    @field_validator('type_parameters')
+    @classmethod
+    def validate_type_parameters(cls, v, info):
+        if v is not None:
+            data_type = info.data.get('data_type')
+            type_validator = _TYPE_PARAM_VALIDATORS.get(data_type)
+            if type_validator:
+                v = type_validator(v, data_type)
         
         return v
-
-
-class ForeignKeyReference(BaseModel):
-    """Represents a foreign key reference"""
-    model_config = ConfigDict(extra='allow', validate_assignment=True)
     
-    referenced_table_id: str = Field(description="ID of the referenced table")
-    referenced_field_id: str = Field(description="ID of the referenced field")
-    constraint_name: Optional[str] = Field(default=None, description="Name of the FK constraint")
-    on_delete: Optional[str] = Field(default="NO ACTION", description="ON DELETE action")
-    on_update: Optional[str] = Field(default="NO ACTION", description="ON UPDATE action")
 
 
 class DataTable(BaseModel):
     """Represents a table in the data model"""
     model_config = ConfigDict(extra='allow', validate_assignment=True)
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str = Field(description="Table name")
     schema_name: Optional[str] = Field(default=None, description="Schema name")
     catalog_name: Optional[str] = Field(default=None, description="Catalog name")
@@ -315,8 +392,15 @@ class DataTable(BaseModel):
     height: float = Field(default=150.0, description="Height of table in ERD")
     
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
+    
+    # (catalog, schema, name, fqn) as last resolved by DataModelProject.get_full_name
+    _fqn_cache: Optional[Tuple[str, str, str, str]] = PrivateAttr(default=None)
+    
+    _intern_location = field_validator('catalog_name', 'schema_name')(_intern_str)
+    _intern_storage = field_validator('table_type', 'file_format')(_intern_str)
+    _intern_tag_keys = field_validator('tags')(_intern_keys)
     
     @field_validator('fields')
     @classmethod
@@ -337,13 +421,14 @@ class DataTable(BaseModel):
     def get_foreign_key_fields(self) -> List[TableField]:
         """Get all foreign key fields"""
         return [field for field in self.fields if field.is_foreign_key]
+    
 
 
 class DataModelRelationship(BaseModel):
     """Represents a relationship between two tables"""
     model_config = ConfigDict(extra='allow', validate_assignment=True)
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     source_table_id: str = Field(description="ID of the source table (PK side)")
     target_table_id: str = Field(description="ID of the target table (FK side)")
     source_field_id: Optional[str] = Field(default=None, description="ID of the source field (PK)")
@@ -357,24 +442,81 @@ class DataModelRelationship(BaseModel):
     
     # UI properties for ERD lines
     line_points: List[Dict[str, float]] = Field(default_factory=list, description="Line points for drawing relationship")
+    
+    _intern_relationship_type = field_validator('relationship_type')(_intern_str)
 
 
 # Metric View Models
 class MetricViewDimension(BaseModel):
     """Represents a dimension in a metric view"""
-    model_config = ConfigDict(extra='allow', validate_assignment=True)
+    model_config = ConfigDict(extra='ignore')
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str = Field(description="Dimension name")
     expr: str = Field(description="SQL expression for the dimension")
     description: Optional[str] = Field(default=None, description="Dimension description")
     data_type: Optional[DatabricksDataType] = Field(default=None, description="Expected data type")
 
+
+_UNBOUNDED_TO_CURRENT_ROW = "ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW"
+
+
+def _window_over(partition_clause: str, order_clause: str, frame: Optional[str] = None) -> str:
+    """Build the OVER (...) clause for a window measure"""
+    parts = [partition_clause, order_clause, frame] if frame else [partition_clause, order_clause]
+    return f"OVER ({' '.join(parts).rstrip()})"
+
+
+def _build_moving_average(measure, expr, partition_clause, order_clause):
+    frame = None
+    if measure.window_size:
+        frame = f"ROWS BETWEEN {measure.window_size - 1} PRECEDING AND CURRENT ROW"
+    return f"AVG({expr}) {_window_over(partition_clause, order_clause, frame)}"
+
+
+def _build_running_sum(measure, expr, partition_clause, order_clause):
+    return f"SUM({expr}) {_window_over(partition_clause, order_clause, _UNBOUNDED_TO_CURRENT_ROW)}"
+
+
+def _build_period_over_period(measure, expr, partition_clause, order_clause):
+    lag = f"LAG({expr}, {measure.offset_periods or 1}) {_window_over(partition_clause, order_clause)}"
+    return f"({expr} - {lag}) / {lag} * 100"
+
+
+def _build_rank(measure, expr, partition_clause, order_clause):
+    return f"RANK() {_window_over(partition_clause, order_clause)}"
+
+
+def _build_row_number(measure, expr, partition_clause, order_clause):
+    return f"ROW_NUMBER() {_window_over(partition_clause, order_clause)}"
+
+
+def _build_percent_of_total(measure, expr, partition_clause, order_clause):
+    return f"{expr} / SUM({expr}) {_window_over(partition_clause, order_clause)} * 100"
+
+
+def _build_custom(measure, expr, partition_clause, order_clause):
+    return f"{expr} {_window_over(partition_clause, order_clause, measure.window_frame)}"
+
+
+# Window measure SQL builders keyed by MetricViewMeasure.window_type
+_WINDOW_BUILDERS = {
+    "moving_average": _build_moving_average,
+    "running_total": _build_running_sum,
+    "period_over_period": _build_period_over_period,
+    "rank": _build_rank,
+    "row_number": _build_row_number,
+    "percent_of_total": _build_percent_of_total,
+    "cumulative_sum": _build_running_sum,
+    "custom": _build_custom,
+}
+
+
 class MetricViewMeasure(BaseModel):
     """Represents a measure in a metric view"""
-    model_config = ConfigDict(extra='allow', validate_assignment=True)
+    model_config = ConfigDict(extra='ignore')
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str = Field(description="Measure name")
     expr: str = Field(description="Aggregate SQL expression")
     description: Optional[str] = Field(default=None, description="Measure description")
@@ -391,6 +533,8 @@ class MetricViewMeasure(BaseModel):
     offset_periods: Optional[int] = Field(default=None, description="Number of periods to offset for period-over-period calculations")
     window_frame: Optional[str] = Field(default=None, description="Custom window frame specification (e.g., 'ROWS BETWEEN 6 PRECEDING AND CURRENT ROW')")
     
+    _intern_aggregation = field_validator('aggregation_type')(_intern_str)
+    
     def generate_window_expression(self, base_measure_expr: str) -> str:
         """Generate the SQL expression for window measures"""
         if not self.is_window_measure or not self.window_type:
@@ -404,51 +548,18 @@ class MetricViewMeasure(BaseModel):
         if self.order_by:
             order_clause = f"ORDER BY {self.order_by}"
         
-        window_clause = f"OVER ({partition_clause} {order_clause}".strip() + ")"
-        
-        if self.window_type == "moving_average":
-            if self.window_size:
-                frame = f"ROWS BETWEEN {self.window_size - 1} PRECEDING AND CURRENT ROW"
-                window_clause = f"OVER ({partition_clause} {order_clause} {frame}".strip() + ")"
-            return f"AVG({base_measure_expr}) {window_clause}"
-        
-        elif self.window_type == "running_total":
-            frame = "ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW"
-            window_clause = f"OVER ({partition_clause} {order_clause} {frame}".strip() + ")"
-            return f"SUM({base_measure_expr}) {window_clause}"
-        
-        elif self.window_type == "period_over_period":
-            if self.offset_periods:
-                return f"({base_measure_expr} - LAG({base_measure_expr}, {self.offset_periods}) {window_clause}) / LAG({base_measure_expr}, {self.offset_periods}) {window_clause} * 100"
-            else:
-                return f"({base_measure_expr} - LAG({base_measure_expr}, 1) {window_clause}) / LAG({base_measure_expr}, 1) {window_clause} * 100"
-        
-        elif self.window_type == "rank":
-            return f"RANK() {window_clause}"
-        
-        elif self.window_type == "row_number":
-            return f"ROW_NUMBER() {window_clause}"
-        
-        elif self.window_type == "percent_of_total":
-            return f"{base_measure_expr} / SUM({base_measure_expr}) {window_clause} * 100"
-        
-        elif self.window_type == "cumulative_sum":
-            frame = "ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW"
-            window_clause = f"OVER ({partition_clause} {order_clause} {frame}".strip() + ")"
-            return f"SUM({base_measure_expr}) {window_clause}"
-        
-        elif self.window_type == "custom" and self.window_frame:
-            window_clause = f"OVER ({partition_clause} {order_clause} {self.window_frame}".strip() + ")"
-            return f"{base_measure_expr} {window_clause}"
+        builder = _WINDOW_BUILDERS.get(self.window_type)
+        if builder:
+            return builder(self, base_measure_expr, partition_clause, order_clause)
         
         # Default fallback
-        return f"{base_measure_expr} {window_clause}"
+        return f"{base_measure_expr} {_window_over(partition_clause, order_clause)}"
 
 class MetricViewJoin(BaseModel):
     """Represents a join in a metric view"""
-    model_config = ConfigDict(extra='allow', validate_assignment=True)
+    model_config = ConfigDict(extra='ignore')
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str = Field(description="Join name/alias")
     sql_on: str = Field(description="JOIN condition SQL")
     join_type: str = Field(default="LEFT", description="Type of join (LEFT, INNER, RIGHT, FULL)")
@@ -474,13 +585,15 @@ class MetricViewJoin(BaseModel):
     bucket_hint: Optional[str] = Field(default=None, description="Bucket join hint if tables are bucketed")
     sort_merge_hint: bool = Field(default=False, description="Whether to use sort-merge join hint")
     
+    _intern_join_type = field_validator('join_type')(_intern_str)
+    
     def generate_join_sql(self, base_table_alias: str = "base") -> str:
         """Generate the complete JOIN SQL statement"""
         if not self.joined_table_name:
             return ""
         
         # Build join type
-        join_clause = f"{self.join_type} JOIN"
+        parts = [self.join_type, " JOIN"]
         
         # Add hints if specified
         hints = []
@@ -492,31 +605,35 @@ class MetricViewJoin(BaseModel):
             hints.append("MERGE")
         
         if hints:
-            join_clause += f" /*+ {', '.join(hints)} */"
+            parts.append(f" /*+ {', '.join(hints)} */")
         
         # Add table name and alias
-        table_part = self.joined_table_name
+        parts.append(" ")
+        parts.append(self.joined_table_name)
         if self.join_alias:
-            table_part += f" AS {self.join_alias}"
+            parts.append(" AS ")
+            parts.append(self.join_alias)
         
         # Build ON condition
         on_condition = self.sql_on
         if not on_condition and self.left_columns and self.right_columns:
             # Auto-generate ON condition from column mappings
             conditions = []
+            left_alias = base_table_alias
+            right_alias = self.join_alias or self.joined_table_name.rsplit('.', 1)[-1]
             for i, (left_col, right_col) in enumerate(zip(self.left_columns, self.right_columns)):
                 operator = self.join_operators[i] if i < len(self.join_operators) else "="
-                left_alias = base_table_alias
-                right_alias = self.join_alias or self.joined_table_name.split('.')[-1]
                 conditions.append(f"{left_alias}.{left_col} {operator} {right_alias}.{right_col}")
             
-            on_condition = " AND ".join(conditions)
-            
             # Add additional conditions if specified
             if self.additional_conditions:
-                on_condition += f" AND {self.additional_conditions}"
+                conditions.append(self.additional_conditions)
+            
+            on_condition = " AND ".join(conditions)
         
-        return f"{join_clause} {table_part} ON {on_condition}"
+        parts.append(" ON ")
+        parts.append(on_condition)
+        return "".join(parts)
     
     def validate_join_condition(self) -> List[str]:
         """Validate the join configuration and return any errors"""
@@ -533,12 +650,46 @@ class MetricViewJoin(BaseModel):
             errors.append("Either sql_on or column mappings (left_columns + right_columns) must be provided")
         
         return errors
+    
+
+_item_id = attrgetter('id')
+
+
+def _item_name_key(item) -> str:
+    """Case-insensitive name key (Databricks identifiers are case-insensitive)"""
+    return item.name.casefold()
+
+
+def _position_index(items: list, key_fn: Callable[[Any], str]) -> Dict[str, int]:
+    """Map each item's key to the position of its first occurrence in `items`"""
+    index = {}
+    for pos, item in enumerate(items):
+        index.setdefault(key_fn(item), pos)
+    return index
+
+
+def _indexed_lookup(owner: BaseModel, items: list, index_attr: str, key_fn: Callable[[Any], str], key: str):
+    """Find the first item whose `key_fn(item)` equals `key` using a position index cached on `owner`
+    
+    Index entries are verified on read, so in-place edits of the lists (append, remove,
+    item replacement, renames) are safe: a stale or missing entry triggers one rebuild.
+    """
+    index = getattr(owner, index_attr)
+    pos = index.get(key)
+    if pos is None or pos >= len(items) or key_fn(items[pos]) != key:
+        index = _position_index(items, key_fn)
+        setattr(owner, index_attr, index)
+        pos = index.get(key)
+        if pos is None:
+            return None
+    return items[pos]
+
 
 class MetricView(BaseModel):
     """Represents a Databricks Metric View"""
     model_config = ConfigDict(extra='allow', validate_assignment=True)
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str = Field(description="Metric view name")
     description: Optional[str] = Field(default=None, description="Metric view description")
     
@@ -567,23 +718,35 @@ class MetricView(BaseModel):
     height: float = Field(default=220.0, description="Height of metric view in ERD")
     
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
+    
+    # Lazily built id -> list position indexes (see _indexed_lookup)
+    _dims_by_id: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _measures_by_id: Dict[str, int] = PrivateAttr(default_factory=dict)
+    # (catalog, schema, name, fqn) as last resolved by DataModelProject.get_full_name
+    _fqn_cache: Optional[Tuple[str, str, str, str]] = PrivateAttr(default=None)
+    # attr -> (datetime, isoformat) as last formatted by cached_isoformat
+    _iso_cache: Dict[str, Tuple[datetime, str]] = PrivateAttr(default_factory=dict)
+    
+    _intern_location = field_validator('catalog_name', 'schema_name')(_intern_str)
+    _intern_tag_keys = field_validator('tags')(_intern_keys)
     
     def get_dimension_by_id(self, dimension_id: str) -> Optional[MetricViewDimension]:
         """Get dimension by ID"""
-        return next((dim for dim in self.dimensions if dim.id == dimension_id), None)
+        return _indexed_lookup(self, self.dimensions, '_dims_by_id', _item_id, dimension_id)
     
     def get_measure_by_id(self, measure_id: str) -> Optional[MetricViewMeasure]:
         """Get measure by ID"""
-        return next((measure for measure in self.measures if measure.id == measure_id), None)
+        return _indexed_lookup(self, self.measures, '_measures_by_id', _item_id, measure_id)
+    
 
 
 class TraditionalView(BaseModel):
     """Represents a traditional SQL view (CREATE VIEW)"""
     model_config = ConfigDict(extra='allow', validate_assignment=True)
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str = Field(description="View name")
     description: Optional[str] = Field(default=None, description="View description")
     
@@ -609,15 +772,24 @@ class TraditionalView(BaseModel):
     height: float = Field(default=180.0, description="Height of view in ERD")
     
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
+    
+    # (catalog, schema, name, fqn) as last resolved by DataModelProject.get_full_name
+    _fqn_cache: Optional[Tuple[str, str, str, str]] = PrivateAttr(default=None)
+    # attr -> (datetime, isoformat) as last formatted by cached_isoformat
+    _iso_cache: Dict[str, Tuple[datetime, str]] = PrivateAttr(default_factory=dict)
+    
+    _intern_names = field_validator('catalog_name', 'schema_name', 'logical_name')(_intern_str)
+    _intern_tag_keys = field_validator('tags')(_intern_keys)
 
 
 class MetricSourceRelationship(BaseModel):
     """Represents the relationship between a table and a metric view"""
-    model_config = ConfigDict(extra='allow', validate_assignment=True)
+    # Immutable once created; unknown keys from API payloads are dropped
+    model_config = ConfigDict(frozen=True, extra='ignore')
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     source_table_id: str = Field(description="ID of the source table")
     metric_view_id: str = Field(description="ID of the metric view")
     relationship_type: str = Field(default="source_to_metric", description="Type of relationship")
@@ -628,14 +800,19 @@ class MetricSourceRelationship(BaseModel):
     # Visual properties for relationship line
     line_points: List[Dict[str, float]] = Field(default_factory=list, description="Line points for drawing relationship")
     
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
+    
+    _intern_relationship_type = field_validator('relationship_type')(_intern_str)
 
 
 class DataModelProject(BaseModel):
     """Represents a complete data modeling project"""
-    model_config = ConfigDict(extra='allow', validate_assignment=True)
+    # Routes only assign already-validated values (child models, datetimes), so
+    # assignments are not re-validated; child models keep validate_assignment.
+    # Unknown top-level keys are dropped (clients only send declared fields)
+    model_config = ConfigDict(extra='ignore')
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str = Field(description="Project name")
     description: Optional[str] = Field(default=None, description="Project description")
     
@@ -652,18 +829,28 @@ class DataModelProject(BaseModel):
     
     # Metadata
     version: str = Field(default="1.0", description="Project version")
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
     created_by: Optional[str] = Field(default=None, description="User who created the project")
     canvas_settings: dict = Field(default_factory=dict, description="Canvas UI settings")
     
+    # Lazily built id / casefolded name -> list position indexes (see _indexed_lookup)
+    _tables_by_id: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _tables_by_name: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _metric_views_by_id: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _metric_views_by_name: Dict[str, int] = PrivateAttr(default_factory=dict)
+    # attr -> (datetime, isoformat) as last formatted by cached_isoformat
+    _iso_cache: Dict[str, Tuple[datetime, str]] = PrivateAttr(default_factory=dict)
+    
+    _intern_location = field_validator('catalog_name', 'schema_name')(_intern_str)
+    
     def get_effective_catalog(self, obj_catalog: Optional[str] = None) -> str:
         """Get the effective catalog name for an object (object's catalog or project default)"""
-        return obj_catalog if obj_catalog else self.catalog_name
+        return obj_catalog or self.catalog_name
     
     def get_effective_schema(self, obj_schema: Optional[str] = None) -> str:
         """Get the effective schema name for an object (object's schema or project default)"""
-        return obj_schema if obj_schema else self.schema_name
+        return obj_schema or self.schema_name
     
     def get_object_full_name(self, obj_name: str, obj_catalog: Optional[str] = None, obj_schema: Optional[str] = None) -> str:
         """Get the fully qualified name for an object"""
@@ -671,63 +858,78 @@ class DataModelProject(BaseModel):
         effective_schema = self.get_effective_schema(obj_schema)
         return f"{effective_catalog}.{effective_schema}.{obj_name}"
     
+    def get_full_name(self, obj: Union['DataTable', 'MetricView', 'TraditionalView']) -> str:
+        """Get the fully qualified name for a table or view, cached on the object
+        
+        The cache is keyed on the resolved catalog, schema and name, so renames or
+        project default changes are picked up on the next call.
+        """
+        catalog = self.get_effective_catalog(obj.catalog_name)
+        schema = self.get_effective_schema(obj.schema_name)
+        cached = obj._fqn_cache
+        if cached is not None and cached[0] == catalog and cached[1] == schema and cached[2] == obj.name:
+            return cached[3]
+        fqn = f"{catalog}.{schema}.{obj.name}"
+        obj._fqn_cache = (catalog, schema, obj.name, fqn)
+        return fqn
+    
     def get_table_by_id(self, table_id: str) -> Optional[DataTable]:
         """Get table by ID"""
-        for table in self.tables:
-            if table.id == table_id:
-                return table
-        return None
+        return _indexed_lookup(self, self.tables, '_tables_by_id', _item_id, table_id)
     
     def get_table_by_name(self, table_name: str) -> Optional[DataTable]:
-        """Get table by name"""
-        for table in self.tables:
-            if table.name == table_name:
-                return table
-        return None
+        """Get table by name (case-insensitive, like Databricks identifiers)"""
+        return _indexed_lookup(self, self.tables, '_tables_by_name', _item_name_key, table_name.casefold())
+    
+    def add_tables(self, tables: Iterable[DataTable]) -> None:
+        """Append several tables at once and rebuild the id/name indexes once for the batch"""
+        self.tables.extend(tables)
+        self._tables_by_id = _position_index(self.tables, _item_id)
+        self._tables_by_name = _position_index(self.tables, _item_name_key)
     
     def get_metric_view_by_id(self, metric_view_id: str) -> Optional[MetricView]:
         """Get metric view by ID"""
-        for metric_view in self.metric_views:
-            if metric_view.id == metric_view_id:
-                return metric_view
-        return None
+        return _indexed_lookup(self, self.metric_views, '_metric_views_by_id', _item_id, metric_view_id)
     
     def get_metric_view_by_name(self, metric_view_name: str) -> Optional[MetricView]:
-        """Get metric view by name"""
-        for metric_view in self.metric_views:
-            if metric_view.name == metric_view_name:
-                return metric_view
-        return None
+        """Get metric view by name (case-insensitive, like Databricks identifiers)"""
+        return _indexed_lookup(
+            self, self.metric_views, '_metric_views_by_name', _item_name_key, metric_view_name.casefold()
+        )
+    
+    def relationships_for_table(self, table_id: str) -> Iterator[DataModelRelationship]:
+        """Iterate relationships where the table is the source or the target"""
+        return (
+            rel for rel in self.relationships
+            if rel.source_table_id == table_id or rel.target_table_id == table_id
+        )
     
     def validate_relationships(self) -> List[str]:
         """Validate all relationships in the project"""
         errors = []
         
+        # Resolve tables and their fields once up front; reversed() keeps the first
+        # occurrence of a duplicate id, matching the linear lookups
+        tables_by_id = {table.id: table for table in reversed(self.tables)}
+        fields_by_table = {
+            table_id: {field.id: field for field in reversed(table.fields)}
+            for table_id, table in tables_by_id.items()
+        }
+        
         for relationship in self.relationships:
-            source_table = self.get_table_by_id(relationship.source_table_id)
-            target_table = self.get_table_by_id(relationship.target_table_id)
+            source_fields = fields_by_table.get(relationship.source_table_id)
+            target_fields = fields_by_table.get(relationship.target_table_id)
             
-            if not source_table:
+            if source_fields is None:
                 errors.append(f"Source table not found for relationship {relationship.id}")
                 continue
                 
-            if not target_table:
+            if target_fields is None:
                 errors.append(f"Target table not found for relationship {relationship.id}")
                 continue
                 
-            # Find source and target fields
-            source_field = None
-            target_field = None
-            
-            for field in source_table.fields:
-                if field.id == relationship.source_field_id:
-                    source_field = field
-                    break
-                    
-            for field in target_table.fields:
-                if field.id == relationship.target_field_id:
-                    target_field = field
-                    break
+            source_field = source_fields.get(relationship.source_field_id)
+            target_field = target_fields.get(relationship.target_field_id)
             
             if not source_field:
                 errors.append(f"Source field not found for relationship {relationship.id}")
@@ -743,14 +945,11 @@ class DataModelProject(BaseModel):
 
 class ExistingTableImport(BaseModel):
     """Model for importing existing tables from Databricks"""
-    model_config = ConfigDict(extra='allow', validate_assignment=True)
+    # Request payloads carry extra keys (session_id, existing_tables) that are read separately
+    model_config = ConfigDict(frozen=True, extra='ignore')
     
     catalog_name: str = Field(description="Catalog name")
     schema_name: str = Field(description="Schema name")
     table_names: List[str] = Field(description="List of table names to import")
     include_constraints: bool = Field(default=True, description="Whether to import existing constraints")
     position_strategy: str = Field(default="auto_layout", description="How to position imported tables")
-
-
-# Update the ForeignKeyReference forward reference
-TableField.model_rebuild()
@@ -1,12 +1,258 @@
 import yaml
-from typing import Dict, Any
+from typing import Any, Callable, Dict, IO, Optional, Tuple, Union
 from datetime import datetime
+from enum import Enum
 from .data_modeling import (
-    DataModelProject, DataTable, TableField, DataModelRelationship, ForeignKeyReference,
+    DatabricksDataType, DataModelProject, DataTable, TableField, DataModelRelationship, ForeignKeyReference,
     MetricView, MetricViewDimension, MetricViewMeasure, MetricViewJoin, MetricSourceRelationship,
-    TraditionalView
+    TraditionalView, batch_now, cached_isoformat
 )
 
+# Prefer the libyaml-backed C implementations; fall back when PyYAML was built without libyaml
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _YAMLLoader
+
+
+class _YAMLDumper(_SafeDumper):
+    """Safe dumper with this module's representers, leaving PyYAML's shared classes untouched"""
+
+
+def _represent_enum(dumper, data):
+    """Represent enums (e.g. DatabricksDataType) as their plain string value"""
+    return dumper.represent_scalar('tag:yaml.org,2002:str', str(data.value))
+
+
+# Registered once for every Enum subclass instead of probing the project on each dump
+_YAMLDumper.add_multi_representer(Enum, _represent_enum)
+
+_DUMP_OPTIONS = {'default_flow_style': False, 'sort_keys': False, 'allow_unicode': True}
+
+# Constructor specs for the YAML -> model direction. Each entry is
+# (keyword argument, YAML key or (section, key) path, default when missing).
+# Nested collections, timestamps and other special cases are passed to the
+# compiled builders explicitly by the _dict_to_* methods.
+_PROJECT_SPEC = (
+    ('name', ('metadata', 'name'), 'Untitled Project'),
+    ('description', ('metadata', 'description'), None),
+    ('version', ('metadata', 'version'), '1.0'),
+    ('created_by', ('metadata', 'created_by'), None),
+    ('catalog_name', ('databricks', 'catalog_name'), ''),
+    ('schema_name', ('databricks', 'schema_name'), ''),
+    ('canvas_settings', 'canvas_settings', {}),
+)
+
+_TABLE_SPEC = (
+    ('id', 'id', None),
+    ('name', 'name', ''),
+    ('logical_name', 'logical_name', None),
+    ('comment', 'comment', None),
+    ('catalog_name', 'catalog_name', None),
+    ('schema_name', 'schema_name', None),
+    ('table_type', 'table_type', 'MANAGED'),
+    ('storage_location', 'storage_location', None),
+    ('file_format', 'file_format', 'DELTA'),
+    ('tags', 'tags', {}),
+    ('position_x', ('position', 'x'), 100.0),
+    ('position_y', ('position', 'y'), 100.0),
+    ('width', ('position', 'width'), 200.0),
+    ('height', ('position', 'height'), 150.0),
+)
+
+_FIELD_SPEC = (
+    ('id', 'id', None),
+    ('name', 'name', ''),
+    ('data_type', 'data_type', 'STRING'),
+    ('type_parameters', 'type_parameters', None),
+    ('nullable', 'nullable', True),
+    ('default_value', 'default_value', None),
+    ('comment', 'comment', None),
+    ('logical_name', 'logical_name', None),
+    ('tags', 'tags', {}),
+    ('is_primary_key', 'is_primary_key', False),
+    ('is_foreign_key', 'is_foreign_key', False),
+)
+
+_FOREIGN_KEY_SPEC = (
+    ('referenced_table_id', 'referenced_table_id', ''),
+    ('referenced_field_id', 'referenced_field_id', ''),
+    ('constraint_name', 'constraint_name', None),
+    ('on_delete', 'on_delete', 'NO ACTION'),
+    ('on_update', 'on_update', 'NO ACTION'),
+)
+
+_RELATIONSHIP_SPEC = (
+    ('id', 'id', None),
+    ('source_table_id', 'source_table_id', ''),
+    ('target_table_id', 'target_table_id', ''),
+    ('source_field_id', 'source_field_id', ''),
+    ('target_field_id', 'target_field_id', ''),
+    ('relationship_type', 'relationship_type', 'one_to_many'),
+    ('constraint_name', 'constraint_name', None),
+    ('line_points', 'line_points', []),
+)
+
+_METRIC_VIEW_SPEC = (
+    ('id', 'id', None),
+    ('name', 'name', ''),
+    ('catalog_name', 'catalog_name', None),
+    ('schema_name', 'schema_name', None),
+    ('description', 'description', None),
+    ('version', 'version', '0.1'),
+    ('source_table_id', 'source_table_id', ''),
+    ('source_sql', 'source_sql', None),
+    ('filter', 'filter', None),
+    ('tags', 'tags', {}),
+    ('position_x', ('position', 'x'), 100.0),
+    ('position_y', ('position', 'y'), 100.0),
+    ('width', ('size', 'width'), 280.0),
+    ('height', ('size', 'height'), 220.0),
+)
+
+_DIMENSION_SPEC = (
+    ('id', 'id', None),
+    ('name', 'name', ''),
+    ('description', 'description', None),
+    ('data_type', 'data_type', None),
+)
+
+_MEASURE_SPEC = (
+    ('id', 'id', None),
+    ('name', 'name', ''),
+    ('description', 'description', None),
+    ('aggregation_type', 'aggregation', 'SUM'),
+    ('is_window_measure', 'is_window_measure', False),
+    ('data_type', 'data_type', None),
+    ('window_type', 'window_type', None),
+    ('window_size', 'window_size', None),
+    ('window_unit', 'window_unit', None),
+    ('partition_by', 'partition_by', []),
+    ('order_by', 'order_by', None),
+    ('offset_periods', 'offset_periods', None),
+    ('window_frame', 'window_frame', None),
+)
+
+_JOIN_SPEC = (
+    ('id', 'id', None),
+    ('name', 'name', ''),
+    ('sql_on', 'sql_on', ''),
+    ('joined_table_id', 'joined_table_id', None),
+    ('joined_table_name', 'joined_table_name', None),
+    ('join_type', 'join_type', 'LEFT'),
+    ('join_alias', 'join_alias', None),
+    ('description', 'description', None),
+    ('left_columns', 'left_columns', []),
+    ('right_columns', 'right_columns', []),
+    ('join_operators', 'join_operators', []),
+    ('additional_conditions', 'additional_conditions', None),
+    ('broadcast_hint', 'broadcast_hint', False),
+    ('bucket_hint', 'bucket_hint', None),
+    ('sort_merge_hint', 'sort_merge_hint', False),
+    ('using', 'using', None),  # CRITICAL: Include USING clause
+)
+
+_METRIC_RELATIONSHIP_SPEC = (
+    ('id', 'id', None),
+    ('source_table_id', 'source_table_id', ''),
+    ('metric_view_id', 'metric_view_id', ''),
+)
+
+_FIELD_MAPPING_SPEC = (
+    ('source_field', 'source_field', ''),
+    ('target_dimension', 'target_dimension', None),
+    ('target_measure', 'target_measure', None),
+    ('mapping_type', 'mapping_type', 'dimension'),
+)
+
+_TRADITIONAL_VIEW_SPEC = (
+    ('id', 'id', None),
+    ('name', 'name', ''),
+    ('description', 'description', None),
+    ('sql_query', 'sql_query', ''),
+    ('tags', 'tags', {}),
+    ('logical_name', 'logical_name', None),
+    ('catalog_name', 'catalog_name', None),
+    ('schema_name', 'schema_name', None),
+    ('referenced_table_ids', 'referenced_table_ids', []),
+    ('referenced_table_names', 'referenced_table_names', []),
+    ('position_x', ('position', 'x'), 100.0),
+    ('position_y', ('position', 'y'), 100.0),
+    ('width', ('size', 'width'), 250.0),
+    ('height', ('size', 'height'), 180.0),
+)
+
+
+_EMPTY_SECTION: Dict[str, Any] = {}
+
+
+def _spec_builder(cls, spec: Tuple[Tuple[str, Any, Any], ...]) -> Callable[..., Any]:
+    """Make a constructor that reads every spec entry from a YAML dict, e.g.
+    ``cls(id=data.get('id', None), ..., **extra)``
+    """
+    def build(data: Dict[str, Any], **extra: Any) -> Any:
+        kwargs = {}
+        for name, key, default in spec:
+            if isinstance(key, tuple):
+                section, key = key
+                kwargs[name] = data.get(section, _EMPTY_SECTION).get(key, default)
+            else:
+                kwargs[name] = data.get(key, default)
+        kwargs.update(extra)
+        return cls(**kwargs)
+    build.__qualname__ = build.__name__ = f'_build_{cls.__name__}'
+    return build
+
+
+_build_project = _spec_builder(DataModelProject, _PROJECT_SPEC)
+_build_table = _spec_builder(DataTable, _TABLE_SPEC)
+_build_field = _spec_builder(TableField, _FIELD_SPEC)
+_build_foreign_key = _spec_builder(ForeignKeyReference, _FOREIGN_KEY_SPEC)
+_build_relationship = _spec_builder(DataModelRelationship, _RELATIONSHIP_SPEC)
+_build_metric_view = _spec_builder(MetricView, _METRIC_VIEW_SPEC)
+_build_dimension = _spec_builder(MetricViewDimension, _DIMENSION_SPEC)
+_build_measure = _spec_builder(MetricViewMeasure, _MEASURE_SPEC)
+_build_join = _spec_builder(MetricViewJoin, _JOIN_SPEC)
+_build_metric_relationship = _spec_builder(MetricSourceRelationship, _METRIC_RELATIONSHIP_SPEC)
+_build_field_mapping = _spec_builder(dict, _FIELD_MAPPING_SPEC)
+_build_traditional_view = _spec_builder(TraditionalView, _TRADITIONAL_VIEW_SPEC)
+
+
+def _nullable_keys(spec: Tuple[Tuple[str, Any, Any], ...], *extra_keys: str) -> frozenset:
+    """YAML keys the loader defaults to None, so None values can be left out of the output"""
+    return frozenset(
+        [key[1] if key.__class__ is tuple else key for _, key, default in spec if default is None] + list(extra_keys)
+    )
+
+
+# Timestamps are nullable too: a missing value loads as now(), exactly like an explicit null
+_METADATA_NULLABLE = _nullable_keys(_PROJECT_SPEC, 'created_at', 'updated_at')
+_TABLE_NULLABLE = _nullable_keys(_TABLE_SPEC)
+_FIELD_NULLABLE = _nullable_keys(_FIELD_SPEC)
+_FOREIGN_KEY_NULLABLE = _nullable_keys(_FOREIGN_KEY_SPEC)
+_RELATIONSHIP_NULLABLE = _nullable_keys(_RELATIONSHIP_SPEC)
+_METRIC_VIEW_NULLABLE = _nullable_keys(_METRIC_VIEW_SPEC, 'created_at', 'updated_at')
+_DIMENSION_NULLABLE = _nullable_keys(_DIMENSION_SPEC)
+_MEASURE_NULLABLE = _nullable_keys(_MEASURE_SPEC)
+_JOIN_NULLABLE = _nullable_keys(_JOIN_SPEC)
+_FIELD_MAPPING_NULLABLE = _nullable_keys(_FIELD_MAPPING_SPEC)
+_TRADITIONAL_VIEW_NULLABLE = _nullable_keys(_TRADITIONAL_VIEW_SPEC, 'created_at', 'updated_at')
+
+
+def _drop_none(mapping: Dict[str, Any], nullable: frozenset) -> Dict[str, Any]:
+    """Leave out None values of nullable keys, keeping key order; required keys are always emitted"""
+    return {key: value for key, value in mapping.items() if value is not None or key not in nullable}
+
+
+def _parse_datetime(value: Optional[str]) -> datetime:
+    """Parse an ISO timestamp, defaulting to now when it is missing"""
+    return datetime.fromisoformat(value) if value else datetime.now()
+
+
+def _expression(data: Dict[str, Any]) -> str:
+    """Read a dimension/measure expression, supporting both 'expression' and 'expr' keys"""
+    return data.get('expression', data.get('expr', ''))
+
 
 class DataModelYAMLSerializer:
     """Handles YAML serialization and deserialization of data modeling projects"""
@@ -15,52 +261,38 @@ class DataModelYAMLSerializer:
     def to_yaml(project: DataModelProject) -> str:
         """Convert DataModelProject to YAML string"""
         project_dict = DataModelYAMLSerializer._project_to_dict(project)
-        
-        # Custom representer to handle enums as strings
-        def represent_enum(dumper, data):
-            return dumper.represent_scalar('tag:yaml.org,2002:str', str(data.value) if hasattr(data, 'value') else str(data))
-        
-        # Find a DatabricksDataType enum to register the representer
-        # Look through all tables and fields to find at least one data type
-        data_type_found = None
-        for table in project.tables:
-            for field in table.fields:
-                if hasattr(field.data_type, 'value'):
-                    data_type_found = type(field.data_type)
-                    break
-            if data_type_found:
-                break
-        
-        # Add custom representer for DatabricksDataType if we found one
-        if data_type_found:
-            yaml.add_representer(data_type_found, represent_enum)
-        
-        try:
-            return yaml.safe_dump(project_dict, default_flow_style=False, sort_keys=False, allow_unicode=True)
-        except Exception as e:
-            # Fallback: convert all enums to strings manually
-            import json
-            json_str = json.dumps(project_dict, default=str)
-            return yaml.safe_dump(json.loads(json_str), default_flow_style=False, sort_keys=False, allow_unicode=True)
+        return yaml.dump(project_dict, Dumper=_YAMLDumper, **_DUMP_OPTIONS)
+    
+    @staticmethod
+    def to_yaml_stream(project: DataModelProject, stream: IO[str]) -> None:
+        """Write DataModelProject as YAML directly to a text stream, without building the string"""
+        project_dict = DataModelYAMLSerializer._project_to_dict(project)
+        yaml.dump(project_dict, stream, Dumper=_YAMLDumper, **_DUMP_OPTIONS)
     
     @staticmethod
     def from_yaml(yaml_content: str) -> DataModelProject:
         """Create DataModelProject from YAML string"""
-        project_dict = yaml.safe_load(yaml_content)
-        return DataModelYAMLSerializer._dict_to_project(project_dict)
+        return DataModelYAMLSerializer.from_yaml_stream(yaml_content)
+    
+    @staticmethod
+    def from_yaml_stream(stream: Union[str, IO[str]]) -> DataModelProject:
+        """Create DataModelProject from a YAML stream (e.g. an open file), parsed incrementally"""
+        project_dict = yaml.load(stream, Loader=_YAMLLoader)
+        with batch_now():
+            return DataModelYAMLSerializer._dict_to_project(project_dict)
     
     @staticmethod
     def _project_to_dict(project: DataModelProject) -> Dict[str, Any]:
         """Convert project to dictionary for YAML serialization"""
         return {
-            'metadata': {
+            'metadata': _drop_none({
                 'name': project.name,
                 'description': project.description,
                 'version': project.version,
-                'created_at': project.created_at.isoformat() if project.created_at else None,
-                'updated_at': project.updated_at.isoformat() if project.updated_at else None,
+                'created_at': cached_isoformat(project, 'created_at'),
+                'updated_at': cached_isoformat(project, 'updated_at'),
                 'created_by': project.created_by
-            },
+            }, _METADATA_NULLABLE),
             'databricks': {
                 'catalog_name': project.catalog_name,
                 'schema_name': project.schema_name
@@ -86,7 +318,7 @@ class DataModelYAMLSerializer:
     @staticmethod
     def _table_to_dict(table: DataTable) -> Dict[str, Any]:
         """Convert table to dictionary"""
-        return {
+        return _drop_none({
             'id': table.id,
             'name': table.name,
             'logical_name': table.logical_name,
@@ -106,15 +338,16 @@ class DataModelYAMLSerializer:
             'fields': [
                 DataModelYAMLSerializer._field_to_dict(field) for field in table.fields
             ]
-        }
+        }, _TABLE_NULLABLE)
     
     @staticmethod
     def _field_to_dict(field: TableField) -> Dict[str, Any]:
         """Convert field to dictionary"""
+        data_type = field.data_type
         field_dict = {
             'id': field.id,
             'name': field.name,
-            'data_type': str(field.data_type.value) if hasattr(field.data_type, 'value') else str(field.data_type),
+            'data_type': data_type.value if data_type.__class__ is DatabricksDataType else str(data_type),
             'type_parameters': field.type_parameters,
             'nullable': field.nullable,
             'default_value': field.default_value,
@@ -126,20 +359,20 @@ class DataModelYAMLSerializer:
         }
         
         if field.foreign_key_reference:
-            field_dict['foreign_key_reference'] = {
+            field_dict['foreign_key_reference'] = _drop_none({
                 'referenced_table_id': field.foreign_key_reference.referenced_table_id,
                 'referenced_field_id': field.foreign_key_reference.referenced_field_id,
                 'constraint_name': field.foreign_key_reference.constraint_name,
                 'on_delete': field.foreign_key_reference.on_delete,
                 'on_update': field.foreign_key_reference.on_update
-            }
+            }, _FOREIGN_KEY_NULLABLE)
         
-        return field_dict
+        return _drop_none(field_dict, _FIELD_NULLABLE)
     
     @staticmethod
     def _relationship_to_dict(relationship: DataModelRelationship) -> Dict[str, Any]:
         """Convert relationship to dictionary"""
-        return {
+        return _drop_none({
             'id': relationship.id,
             'source_table_id': relationship.source_table_id,
             'target_table_id': relationship.target_table_id,
@@ -148,12 +381,12 @@ class DataModelYAMLSerializer:
             'relationship_type': relationship.relationship_type,
             'constraint_name': relationship.constraint_name,
             'line_points': relationship.line_points
-        }
+        }, _RELATIONSHIP_NULLABLE)
     
     @staticmethod
     def _metric_view_to_dict(metric_view: MetricView) -> Dict[str, Any]:
         """Convert metric view to dictionary"""
-        return {
+        return _drop_none({
             'id': metric_view.id,
             'name': metric_view.name,
             'description': metric_view.description,
@@ -181,20 +414,20 @@ class DataModelYAMLSerializer:
                 'width': metric_view.width,
                 'height': metric_view.height
             },
-            'created_at': metric_view.created_at.isoformat() if metric_view.created_at else None,
-            'updated_at': metric_view.updated_at.isoformat() if metric_view.updated_at else None
-        }
+            'created_at': cached_isoformat(metric_view, 'created_at'),
+            'updated_at': cached_isoformat(metric_view, 'updated_at')
+        }, _METRIC_VIEW_NULLABLE)
     
     @staticmethod
     def _dimension_to_dict(dimension: MetricViewDimension) -> Dict[str, Any]:
         """Convert dimension to dictionary"""
-        return {
+        return _drop_none({
             'id': dimension.id,
             'name': dimension.name,
             'expression': dimension.expr,
             'description': dimension.description,
             'data_type': dimension.data_type
-        }
+        }, _DIMENSION_NULLABLE)
     
     @staticmethod
     def _measure_to_dict(measure: MetricViewMeasure) -> Dict[str, Any]:
@@ -221,7 +454,7 @@ class DataModelYAMLSerializer:
                 'window_frame': measure.window_frame
             })
         
-        return measure_dict
+        return _drop_none(measure_dict, _MEASURE_NULLABLE)
     
     @staticmethod
     def _join_to_dict(join: MetricViewJoin) -> Dict[str, Any]:
@@ -251,12 +484,12 @@ class DataModelYAMLSerializer:
                 DataModelYAMLSerializer._join_to_dict(nested_join) for nested_join in join.joins
             ]
         
-        return join_dict
+        return _drop_none(join_dict, _JOIN_NULLABLE)
     
     @staticmethod
     def _traditional_view_to_dict(traditional_view: TraditionalView) -> Dict[str, Any]:
         """Convert traditional view to dictionary"""
-        return {
+        return _drop_none({
             'id': traditional_view.id,
             'name': traditional_view.name,
             'description': traditional_view.description,
@@ -275,9 +508,9 @@ class DataModelYAMLSerializer:
                 'width': traditional_view.width,
                 'height': traditional_view.height
             },
-            'created_at': traditional_view.created_at.isoformat() if traditional_view.created_at else None,
-            'updated_at': traditional_view.updated_at.isoformat() if traditional_view.updated_at else None
-        }
+            'created_at': cached_isoformat(traditional_view, 'created_at'),
+            'updated_at': cached_isoformat(traditional_view, 'updated_at')
+        }, _TRADITIONAL_VIEW_NULLABLE)
 
     @staticmethod
     def _metric_relationship_to_dict(metric_rel: MetricSourceRelationship) -> Dict[str, Any]:
@@ -287,12 +520,12 @@ class DataModelYAMLSerializer:
             'source_table_id': metric_rel.source_table_id,
             'metric_view_id': metric_rel.metric_view_id,
             'field_mappings': [
-                {
-                    'source_field': mapping.source_field,
-                    'target_dimension': mapping.target_dimension,
-                    'target_measure': mapping.target_measure,
-                    'mapping_type': mapping.mapping_type
-                }
+                _drop_none({
+                    'source_field': mapping.get('source_field', ''),
+                    'target_dimension': mapping.get('target_dimension'),
+                    'target_measure': mapping.get('target_measure'),
+                    'mapping_type': mapping.get('mapping_type', 'dimension')
+                }, _FIELD_MAPPING_NULLABLE)
                 for mapping in metric_rel.field_mappings
             ]
         }
@@ -300,290 +533,97 @@ class DataModelYAMLSerializer:
     @staticmethod
     def _dict_to_project(project_dict: Dict[str, Any]) -> DataModelProject:
         """Convert dictionary to DataModelProject"""
-        metadata = project_dict.get('metadata', {})
-        databricks = project_dict.get('databricks', {})
-        
-        # Parse dates
-        created_at = None
-        updated_at = None
-        
-        if metadata.get('created_at'):
-            created_at = datetime.fromisoformat(metadata['created_at'])
-        if metadata.get('updated_at'):
-            updated_at = datetime.fromisoformat(metadata['updated_at'])
-        
-        # Parse tables
-        tables = []
-        for table_dict in project_dict.get('tables', []):
-            tables.append(DataModelYAMLSerializer._dict_to_table(table_dict))
-        
-        # Parse relationships
-        relationships = []
-        for rel_dict in project_dict.get('relationships', []):
-            relationships.append(DataModelYAMLSerializer._dict_to_relationship(rel_dict))
-        
-        # Parse metric views
-        metric_views = []
-        for mv_dict in project_dict.get('metric_views', []):
-            metric_views.append(DataModelYAMLSerializer._dict_to_metric_view(mv_dict))
-        
-        # Parse traditional views
-        traditional_views = []
-        for tv_dict in project_dict.get('traditional_views', []):
-            traditional_views.append(DataModelYAMLSerializer._dict_to_traditional_view(tv_dict))
-        
-        # Parse metric relationships
-        metric_relationships = []
-        for mr_dict in project_dict.get('metric_relationships', []):
-            metric_relationships.append(DataModelYAMLSerializer._dict_to_metric_relationship(mr_dict))
-        
-        return DataModelProject(
-            name=metadata.get('name', 'Untitled Project'),
-            description=metadata.get('description'),
-            version=metadata.get('version', '1.0'),
-            created_at=created_at or datetime.now(),
-            updated_at=updated_at or datetime.now(),
-            created_by=metadata.get('created_by'),
-            catalog_name=databricks.get('catalog_name', ''),
-            schema_name=databricks.get('schema_name', ''),
-            tables=tables,
-            relationships=relationships,
-            metric_views=metric_views,
-            traditional_views=traditional_views,
-            metric_relationships=metric_relationships,
-            canvas_settings=project_dict.get('canvas_settings', {})
+        metadata = project_dict.get('metadata', _EMPTY_SECTION)
+        return _build_project(
+            project_dict,
+            created_at=_parse_datetime(metadata.get('created_at')),
+            updated_at=_parse_datetime(metadata.get('updated_at')),
+            tables=[
+                DataModelYAMLSerializer._dict_to_table(table_dict) for table_dict in project_dict.get('tables', ())
+            ],
+            relationships=[
+                DataModelYAMLSerializer._dict_to_relationship(rel_dict) for rel_dict in project_dict.get('relationships', ())
+            ],
+            metric_views=[
+                DataModelYAMLSerializer._dict_to_metric_view(mv_dict) for mv_dict in project_dict.get('metric_views', ())
+            ],
+            traditional_views=[
+                DataModelYAMLSerializer._dict_to_traditional_view(tv_dict) for tv_dict in project_dict.get('traditional_views', ())
+            ],
+            metric_relationships=[
+                DataModelYAMLSerializer._dict_to_metric_relationship(mr_dict) for mr_dict in project_dict.get('metric_relationships', ())
+            ]
         )
     
     @staticmethod
     def _dict_to_table(table_dict: Dict[str, Any]) -> DataTable:
         """Convert dictionary to DataTable"""
-        position = table_dict.get('position', {})
-        
-        # Parse fields
-        fields = []
-        for field_dict in table_dict.get('fields', []):
-            fields.append(DataModelYAMLSerializer._dict_to_field(field_dict))
-        
-        return DataTable(
-            id=table_dict.get('id'),
-            name=table_dict.get('name', ''),
-            logical_name=table_dict.get('logical_name'),
-            comment=table_dict.get('comment'),
-            catalog_name=table_dict.get('catalog_name'),
-            schema_name=table_dict.get('schema_name'),
-            table_type=table_dict.get('table_type', 'MANAGED'),
-            storage_location=table_dict.get('storage_location'),
-            file_format=table_dict.get('file_format', 'DELTA'),
-            tags=table_dict.get('tags', {}),
-            position_x=position.get('x', 100.0),
-            position_y=position.get('y', 100.0),
-            width=position.get('width', 200.0),
-            height=position.get('height', 150.0),
-            fields=fields
+        return _build_table(
+            table_dict,
+            fields=[DataModelYAMLSerializer._dict_to_field(field_dict) for field_dict in table_dict.get('fields', ())]
         )
     
     @staticmethod
     def _dict_to_field(field_dict: Dict[str, Any]) -> TableField:
         """Convert dictionary to TableField"""
         # Parse foreign key reference if present
-        fk_ref = None
-        if field_dict.get('foreign_key_reference'):
-            fk_data = field_dict['foreign_key_reference']
-            fk_ref = ForeignKeyReference(
-                referenced_table_id=fk_data.get('referenced_table_id', ''),
-                referenced_field_id=fk_data.get('referenced_field_id', ''),
-                constraint_name=fk_data.get('constraint_name'),
-                on_delete=fk_data.get('on_delete', 'NO ACTION'),
-                on_update=fk_data.get('on_update', 'NO ACTION')
-            )
-        
-        return TableField(
-            id=field_dict.get('id'),
-            name=field_dict.get('name', ''),
-            data_type=field_dict.get('data_type', 'STRING'),
-            type_parameters=field_dict.get('type_parameters'),
-            nullable=field_dict.get('nullable', True),
-            default_value=field_dict.get('default_value'),
-            comment=field_dict.get('comment'),
-            logical_name=field_dict.get('logical_name'),
-            tags=field_dict.get('tags', {}),
-            is_primary_key=field_dict.get('is_primary_key', False),
-            is_foreign_key=field_dict.get('is_foreign_key', False),
-            foreign_key_reference=fk_ref
-        )
+        fk_data = field_dict.get('foreign_key_reference')
+        fk_ref = _build_foreign_key(fk_data) if fk_data else None
+        return _build_field(field_dict, foreign_key_reference=fk_ref)
     
     @staticmethod
     def _dict_to_relationship(rel_dict: Dict[str, Any]) -> DataModelRelationship:
         """Convert dictionary to DataModelRelationship"""
-        return DataModelRelationship(
-            id=rel_dict.get('id'),
-            source_table_id=rel_dict.get('source_table_id', ''),
-            target_table_id=rel_dict.get('target_table_id', ''),
-            source_field_id=rel_dict.get('source_field_id', ''),
-            target_field_id=rel_dict.get('target_field_id', ''),
-            relationship_type=rel_dict.get('relationship_type', 'one_to_many'),
-            constraint_name=rel_dict.get('constraint_name'),
-            line_points=rel_dict.get('line_points', [])
-        )
+        return _build_relationship(rel_dict)
     
     @staticmethod
     def _dict_to_metric_view(mv_dict: Dict[str, Any]) -> MetricView:
         """Convert dictionary to MetricView"""
-        position = mv_dict.get('position', {})
-        size = mv_dict.get('size', {})
-        
-        # Parse dates
-        created_at = None
-        updated_at = None
-        if mv_dict.get('created_at'):
-            created_at = datetime.fromisoformat(mv_dict['created_at'])
-        if mv_dict.get('updated_at'):
-            updated_at = datetime.fromisoformat(mv_dict['updated_at'])
-        
-        # Parse dimensions
-        dimensions = []
-        for dim_dict in mv_dict.get('dimensions', []):
-            dimensions.append(DataModelYAMLSerializer._dict_to_dimension(dim_dict))
-        
-        # Parse measures
-        measures = []
-        for measure_dict in mv_dict.get('measures', []):
-            measures.append(DataModelYAMLSerializer._dict_to_measure(measure_dict))
-        
-        # Parse joins
-        joins = []
-        for join_dict in mv_dict.get('joins', []):
-            joins.append(DataModelYAMLSerializer._dict_to_join(join_dict))
-        
-        return MetricView(
-            id=mv_dict.get('id'),
-            name=mv_dict.get('name', ''),
-            catalog_name=mv_dict.get('catalog_name'),
-            schema_name=mv_dict.get('schema_name'),
-            description=mv_dict.get('description'),
-            version=mv_dict.get('version', '0.1'),
-            source_table_id=mv_dict.get('source_table_id', ''),
-            source_sql=mv_dict.get('source_sql'),
-            filter=mv_dict.get('filter'),
-            dimensions=dimensions,
-            measures=measures,
-            joins=joins,
-            tags=mv_dict.get('tags', {}),
-            position_x=position.get('x', 100.0),
-            position_y=position.get('y', 100.0),
-            width=size.get('width', 280.0),
-            height=size.get('height', 220.0),
-            created_at=created_at or datetime.now(),
-            updated_at=updated_at or datetime.now()
+        return _build_metric_view(
+            mv_dict,
+            dimensions=[
+                DataModelYAMLSerializer._dict_to_dimension(dim_dict) for dim_dict in mv_dict.get('dimensions', ())
+            ],
+            measures=[
+                DataModelYAMLSerializer._dict_to_measure(measure_dict) for measure_dict in mv_dict.get('measures', ())
+            ],
+            joins=[DataModelYAMLSerializer._dict_to_join(join_dict) for join_dict in mv_dict.get('joins', ())],
+            created_at=_parse_datetime(mv_dict.get('created_at')),
+            updated_at=_parse_datetime(mv_dict.get('updated_at'))
         )
     
     @staticmethod
     def _dict_to_dimension(dim_dict: Dict[str, Any]) -> MetricViewDimension:
         """Convert dictionary to MetricViewDimension"""
-        return MetricViewDimension(
-            id=dim_dict.get('id'),
-            name=dim_dict.get('name', ''),
-            expr=dim_dict.get('expression', dim_dict.get('expr', '')),  # Support both 'expression' and 'expr' fields
-            description=dim_dict.get('description'),
-            data_type=dim_dict.get('data_type')
-        )
+        return _build_dimension(dim_dict, expr=_expression(dim_dict))
     
     @staticmethod
     def _dict_to_measure(measure_dict: Dict[str, Any]) -> MetricViewMeasure:
         """Convert dictionary to MetricViewMeasure"""
-        return MetricViewMeasure(
-            id=measure_dict.get('id'),
-            name=measure_dict.get('name', ''),
-            expr=measure_dict.get('expression', measure_dict.get('expr', '')),  # Support both 'expression' and 'expr' fields
-            description=measure_dict.get('description'),
-            aggregation_type=measure_dict.get('aggregation', 'SUM'),
-            is_window_measure=measure_dict.get('is_window_measure', False),
-            data_type=measure_dict.get('data_type'),
-            window_type=measure_dict.get('window_type'),
-            window_size=measure_dict.get('window_size'),
-            window_unit=measure_dict.get('window_unit'),
-            partition_by=measure_dict.get('partition_by', []),
-            order_by=measure_dict.get('order_by'),
-            offset_periods=measure_dict.get('offset_periods'),
-            window_frame=measure_dict.get('window_frame')
-        )
+        return _build_measure(measure_dict, expr=_expression(measure_dict))
     
     @staticmethod
     def _dict_to_join(join_dict: Dict[str, Any]) -> MetricViewJoin:
         """Convert dictionary to MetricViewJoin"""
         # CRITICAL: Parse nested joins recursively
-        nested_joins = []
-        for nested_join_dict in join_dict.get('joins', []):
-            nested_joins.append(DataModelYAMLSerializer._dict_to_join(nested_join_dict))
-        
-        return MetricViewJoin(
-            id=join_dict.get('id'),
-            name=join_dict.get('name', ''),
-            sql_on=join_dict.get('sql_on', ''),
-            joined_table_id=join_dict.get('joined_table_id'),
-            joined_table_name=join_dict.get('joined_table_name'),
-            join_type=join_dict.get('join_type', 'LEFT'),
-            join_alias=join_dict.get('join_alias'),
-            description=join_dict.get('description'),
-            left_columns=join_dict.get('left_columns', []),
-            right_columns=join_dict.get('right_columns', []),
-            join_operators=join_dict.get('join_operators', []),
-            additional_conditions=join_dict.get('additional_conditions'),
-            broadcast_hint=join_dict.get('broadcast_hint', False),
-            bucket_hint=join_dict.get('bucket_hint'),
-            sort_merge_hint=join_dict.get('sort_merge_hint', False),
-            using=join_dict.get('using'),  # CRITICAL: Include USING clause
-            joins=nested_joins if nested_joins else None  # CRITICAL: Include nested joins
-        )
+        nested_joins = [
+            DataModelYAMLSerializer._dict_to_join(nested_join_dict) for nested_join_dict in join_dict.get('joins', ())
+        ]
+        return _build_join(join_dict, joins=nested_joins if nested_joins else None)
     
     @staticmethod
     def _dict_to_metric_relationship(mr_dict: Dict[str, Any]) -> MetricSourceRelationship:
         """Convert dictionary to MetricSourceRelationship"""
-        field_mappings = []
-        for mapping_dict in mr_dict.get('field_mappings', []):
-            field_mappings.append({
-                'source_field': mapping_dict.get('source_field', ''),
-                'target_dimension': mapping_dict.get('target_dimension'),
-                'target_measure': mapping_dict.get('target_measure'),
-                'mapping_type': mapping_dict.get('mapping_type', 'dimension')
-            })
-        
-        return MetricSourceRelationship(
-            id=mr_dict.get('id'),
-            source_table_id=mr_dict.get('source_table_id', ''),
-            metric_view_id=mr_dict.get('metric_view_id', ''),
-            field_mappings=field_mappings
-        )
+        field_mappings = [
+            _build_field_mapping(mapping_dict) for mapping_dict in mr_dict.get('field_mappings', ())
+        ]
+        return _build_metric_relationship(mr_dict, field_mappings=field_mappings)
     
     @staticmethod
     def _dict_to_traditional_view(tv_dict: Dict[str, Any]) -> TraditionalView:
         """Convert dictionary to TraditionalView"""
-        position = tv_dict.get('position', {})
-        size = tv_dict.get('size', {})
-        
-        # Parse dates
-        created_at = None
-        updated_at = None
-        if tv_dict.get('created_at'):
-            created_at = datetime.fromisoformat(tv_dict['created_at'])
-        if tv_dict.get('updated_at'):
-            updated_at = datetime.fromisoformat(tv_dict['updated_at'])
-        
-        return TraditionalView(
-            id=tv_dict.get('id'),
-            name=tv_dict.get('name', ''),
-            description=tv_dict.get('description'),
-            sql_query=tv_dict.get('sql_query', ''),
-            tags=tv_dict.get('tags', {}),
-            logical_name=tv_dict.get('logical_name'),
-            catalog_name=tv_dict.get('catalog_name'),
-            schema_name=tv_dict.get('schema_name'),
-            referenced_table_ids=tv_dict.get('referenced_table_ids', []),
-            referenced_table_names=tv_dict.get('referenced_table_names', []),
-            position_x=position.get('x', 100.0),
-            position_y=position.get('y', 100.0),
-            width=size.get('width', 250.0),
-            height=size.get('height', 180.0),
-            created_at=created_at or datetime.now(),
-            updated_at=updated_at or datetime.now()
+        return _build_traditional_view(
+            tv_dict,
+            created_at=_parse_datetime(tv_dict.get('created_at')),
+            updated_at=_parse_datetime(tv_dict.get('updated_at'))
         )